@@ -0,0 +1,209 @@
+"""Play many headless games of levels x build orders across a process pool.
+
+Usage (from the repository root):
+
+    python -m benchmarks.batch_runner                         # every level x every build order
+    python -m benchmarks.batch_runner -l 1 -o basic_line -n 64 --workers 8
+    python -m benchmarks.batch_runner --orders-file orders.json --json report.json
+
+Each job's seed comes from --seed and its run number only, so the same
+arguments always produce the same report however the jobs land on the
+workers, and run i of every build order plays with the same luck.
+"""
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from core.constants import *
+from core.event_log import event_log
+from core.frame_profiler import percentile
+from core.LevelManager import LevelManager
+from core.map_loader import load_path
+from core.simulation import Simulation
+from benchmarks.build_orders import BUILD_ORDERS, load_build_orders
+
+# Commands that return None when they can't be afforded yet
+SPENDING_COMMANDS = {"place_tower", "upgrade", "gamble"}
+
+
+def job_seed(base_seed, run):
+    return base_seed * 100003 + run
+
+
+def run_job(level_id, order, run, seed, max_ticks, sample_seconds):
+    """Play one game headlessly and return its raw result"""
+    event_log.configure(level="warning", echo_level="error")
+    level_data = LevelManager().levels[level_id]
+    sim = Simulation.from_level(level_data, seed=seed)
+    steps = deque(order.commands(sim.path_table))
+    step_count = len(steps)
+    delta_time = 1.0 / SIM_TICK_RATE
+    sample_ticks = max(1, round(sample_seconds * SIM_TICK_RATE))
+    money_curve = []
+
+    while sim.tick < max_ticks and not sim.is_over():
+        # Buy as much of the build order as the money allows, in order
+        while steps:
+            command, args = steps[0]
+            if sim.execute(command, *args) is None and command in SPENDING_COMMANDS:
+                break
+            steps.popleft()
+        if sim.tick % sample_ticks == 0:
+            money_curve.append(sim.money)
+        sim.step(delta_time)
+
+    return {
+        "level": level_id,
+        "order": order.name,
+        "run": run,
+        "seed": seed,
+        "won": sim.level_complete and sim.lives > 0,
+        "lives_lost": level_data.lives - sim.lives,
+        "seconds": sim.time,
+        "final_money": sim.money,
+        "steps_done": step_count - len(steps),
+        "money_curve": money_curve,
+        "wave_clear_seconds": [
+            wave.cleared_time - wave.start_time if wave.cleared_time is not None else None
+            for wave in sim.timeline.waves
+        ],
+    }
+
+
+def mean(values):
+    return sum(values) / len(values) if values else None
+
+
+def aggregate(results, sample_seconds):
+    """Fold the runs of one level and build order into summary numbers"""
+    won = [result for result in results if result["won"]]
+    wave_count = max(len(result["wave_clear_seconds"]) for result in results)
+    waves = []
+    for index in range(wave_count):
+        times = [result["wave_clear_seconds"][index] for result in results
+                 if result["wave_clear_seconds"][index] is not None]
+        waves.append({
+            "cleared_rate": len(times) / len(results),
+            "mean_seconds": mean(times),
+            "p95_seconds": percentile(times, 95) if times else None,
+        })
+
+    # Games end at different times; each sample averages the games still running
+    curve_length = max(len(result["money_curve"]) for result in results)
+    money_curve = [
+        mean([result["money_curve"][i] for result in results if i < len(result["money_curve"])])
+        for i in range(curve_length)
+    ]
+
+    return {
+        "runs": len(results),
+        "win_rate": len(won) / len(results),
+        "lives_lost_mean": mean([result["lives_lost"] for result in results]),
+        "lives_lost_max": max(result["lives_lost"] for result in results),
+        "clear_seconds_mean": mean([result["seconds"] for result in won]),
+        "final_money_mean": mean([result["final_money"] for result in results]),
+        "steps_done_mean": mean([result["steps_done"] for result in results]),
+        "waves": waves,
+        "money_curve_interval": sample_seconds,
+        "money_curve": money_curve,
+    }
+
+
+def print_report(report):
+    for level_id, orders in report.items():
+        print(f"\n== Level {level_id}")
+        print(f"   {'build order':<16} {'runs':>5} {'win %':>6} {'lives lost':>11} {'clear s':>8} {'final $':>8}")
+        for name, summary in orders.items():
+            if "error" in summary:
+                print(f"   {name:<16} failed: {summary['error']}")
+                continue
+            clear = summary["clear_seconds_mean"]
+            print(f"   {name:<16} {summary['runs']:>5} {summary['win_rate'] * 100:>6.1f} "
+                  f"{summary['lives_lost_mean']:>5.1f} (max {summary['lives_lost_max']:>2}) "
+                  f"{clear if clear is not None else float('nan'):>8.1f} {summary['final_money_mean']:>8.0f}")
+            for index, wave in enumerate(summary["waves"]):
+                if wave["mean_seconds"] is None:
+                    print(f"      wave {index + 1}: never cleared")
+                else:
+                    print(f"      wave {index + 1}: cleared {wave['cleared_rate'] * 100:.0f}%, "
+                          f"{wave['mean_seconds']:.1f} s mean, {wave['p95_seconds']:.1f} s p95")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate levels and build orders over many headless games")
+    parser.add_argument("-l", "--level", type=int, action="append", help="level number (repeatable, default: all)")
+    parser.add_argument("-o", "--order", action="append", help="build order name (repeatable, default: all)")
+    parser.add_argument("--orders-file", help="JSON file of extra build orders (see benchmarks/build_orders.py)")
+    parser.add_argument("-n", "--runs", type=int, default=16, help="games per level and build order")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for the per-run seeds")
+    parser.add_argument("--max-minutes", type=float, default=20, help="game minutes before a run is cut off")
+    parser.add_argument("--sample-seconds", type=float, default=5, help="money curve sample interval")
+    parser.add_argument("--json", help="write the full report to this file")
+    args = parser.parse_args(argv)
+
+    build_orders = dict(BUILD_ORDERS)
+    if args.orders_file:
+        build_orders.update(load_build_orders(args.orders_file))
+    for name in args.order or ():
+        if name not in build_orders:
+            parser.error(f"unknown build order {name!r} (have: {', '.join(sorted(build_orders))})")
+    orders = [build_orders[name] for name in args.order or sorted(build_orders)]
+    levels = LevelManager().levels
+    level_ids = args.level or sorted(levels)
+    max_ticks = round(args.max_minutes * 60 * SIM_TICK_RATE)
+
+    # Compile each map's cache once here, so the workers don't all race to write it
+    broken = {}
+    for level_id in level_ids:
+        try:
+            load_path(levels[level_id].map_path, TILE_SCALING, use_cache=MAP_CACHE_ENABLED)
+        except Exception as e:
+            broken[level_id] = f"{type(e).__name__}: {e}"
+
+    started = time.perf_counter()
+    results = {}
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {}
+        for level_id in level_ids:
+            if level_id in broken:
+                continue
+            for order in orders:
+                for run in range(args.runs):
+                    future = pool.submit(run_job, level_id, order, run, job_seed(args.seed, run),
+                                         max_ticks, args.sample_seconds)
+                    futures[(level_id, order.name, run)] = future
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                results[key] = e
+
+    report = {}
+    for level_id in level_ids:
+        report[level_id] = {}
+        for order in orders:
+            if level_id in broken:
+                report[level_id][order.name] = {"error": broken[level_id]}
+                continue
+            runs = [results[(level_id, order.name, run)] for run in range(args.runs)]
+            errors = [run for run in runs if isinstance(run, Exception)]
+            if errors:
+                report[level_id][order.name] = {"error": f"{type(errors[0]).__name__}: {errors[0]}"}
+            else:
+                report[level_id][order.name] = aggregate(runs, args.sample_seconds)
+
+    print_report(report)
+    print(f"\n{len(futures)} games in {time.perf_counter() - started:.1f} s on {args.workers} workers")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
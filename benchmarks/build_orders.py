@@ -0,0 +1,68 @@
+"""Tower build orders for the batch runner.
+
+A build order is a list of steps, carried out in order as soon as each one
+can be afforded (the next step waits for the current one):
+
+    ("place", tower_type, along, side)  tower at a fraction along the path, side px off it
+    ("upgrade", tower, path)            tower is the placement number, from 0
+    ("gamble", tower)
+    ("targeting", tower, mode)
+
+Placements are given relative to the path so the same order works on
+every map. Orders can also be loaded from a JSON file holding
+{"name": {"description": ..., "steps": [[...], ...]}}.
+"""
+import json
+
+
+class BuildOrder:
+    def __init__(self, name, description, steps):
+        self.name = name
+        self.description = description
+        self.steps = [tuple(step) for step in steps]
+
+    def commands(self, path_table):
+        """Turn the steps into (command, args) for Simulation.execute on a given path"""
+        commands = []
+        for action, *args in self.steps:
+            if action == "place":
+                tower_type, along, side = args
+                distance = along * path_table.total_length
+                x, y = path_table.position(distance)
+                ux, uy = path_table.direction(distance)
+                commands.append(("place_tower", (tower_type, x - uy * side, y + ux * side)))
+            elif action in ("upgrade", "gamble", "targeting"):
+                commands.append((action, tuple(args)))
+            else:
+                raise ValueError(f"Unknown build order step {action!r} in {self.name}")
+        return commands
+
+
+def load_build_orders(path):
+    with open(path) as f:
+        data = json.load(f)
+    return {name: BuildOrder(name, spec.get("description", ""), spec["steps"]) for name, spec in data.items()}
+
+
+BUILD_ORDERS = {
+    order.name: order for order in [
+        BuildOrder(
+            "basic_line",
+            "Four basic towers spread along the path, then damage upgrades round-robin",
+            [("place", "basic", along, 40) for along in (0.2, 0.4, 0.6, 0.8)]
+            + [("upgrade", tower, "damage") for _ in range(3) for tower in range(4)],
+        ),
+        BuildOrder(
+            "front_snipers",
+            "Two snipers near the spawn on first targeting, then range upgrades",
+            [("place", "sniper", 0.15, 50), ("place", "sniper", 0.3, -50)]
+            + [("upgrade", tower, "range") for _ in range(3) for tower in range(2)],
+        ),
+        BuildOrder(
+            "gamble_rush",
+            "Two archers, then every upgrade spent on the gamble wheel",
+            [("place", "archer", 0.3, 40), ("place", "archer", 0.6, -40)]
+            + [("gamble", tower) for _ in range(4) for tower in range(2)],
+        ),
+    ]
+}
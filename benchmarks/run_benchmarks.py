@@ -0,0 +1,182 @@
+"""Scenario benchmarks for the simulation update phases and on_draw.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run_benchmarks                     # run all, compare to baseline
+    python -m benchmarks.run_benchmarks -s max_level_sniper_spam
+    python -m benchmarks.run_benchmarks --save-baseline     # store current numbers
+    python -m benchmarks.run_benchmarks --draw              # also time on_draw (needs a display)
+    python -m benchmarks.run_benchmarks --enemy-store       # use the NumPy enemy store
+    python -m benchmarks.run_benchmarks --require-baseline  # CI: a missing baseline is a failure
+
+Exits with status 1 if any scenario regressed past the tolerance, or if
+--require-baseline is given and there is no baseline to compare against.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from core.constants import *
+from core.event_log import event_log
+from core.simulation import Simulation
+from core.frame_profiler import percentile
+from benchmarks.scenarios import SCENARIOS
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+TICK_DT = 1 / 60
+WARMUP_TICKS = 30
+
+
+def summarize(samples):
+    """p50/p95/p99/mean of a list of durations in seconds, reported in milliseconds"""
+    return {
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "mean_ms": sum(samples) / len(samples) * 1000 if samples else 0.0,
+    }
+
+
+def run_scenario(scenario, ticks=None, draw=False, use_enemy_store=False):
+    """Run one scenario and return its report dict"""
+    ticks = ticks or scenario.ticks
+    level_data = scenario.level_data()
+
+    view = None
+    if draw:
+        from core.game_view import TowerDefenseGame
+        view = TowerDefenseGame(level_data, use_enemy_store=use_enemy_store)
+        sim = view.sim
+    else:
+        sim = Simulation.from_level(level_data, use_enemy_store=use_enemy_store)
+    scenario.populate(sim)
+
+    for _ in range(WARMUP_TICKS):
+        sim.step(TICK_DT)
+
+    timings = {}
+    tick_times = []
+    started = time.perf_counter()
+    for _ in range(ticks):
+        tick_start = time.perf_counter()
+        sim.step(TICK_DT, timings)
+        tick_times.append(time.perf_counter() - tick_start)
+        if view:
+            draw_start = time.perf_counter()
+            view.on_draw()
+            view.window.ctx.finish()
+            timings.setdefault("on_draw", []).append(time.perf_counter() - draw_start)
+    elapsed = time.perf_counter() - started
+
+    phases = {"tick": summarize(tick_times)}
+    for name, samples in timings.items():
+        phases[name] = summarize(samples)
+
+    return {
+        "description": scenario.description,
+        "ticks": ticks,
+        "ticks_per_sec": ticks / sum(tick_times) if tick_times else 0.0,
+        "wall_seconds": elapsed,
+        "enemies_left": sim.enemy_count,
+        "phases": phases,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regression messages for results that are worse than the baseline"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+
+        if result["ticks_per_sec"] < base["ticks_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: ticks/sec {result['ticks_per_sec']:.1f} < baseline {base['ticks_per_sec']:.1f}"
+            )
+
+        for phase, stats in result["phases"].items():
+            base_stats = base["phases"].get(phase)
+            if not base_stats:
+                continue
+            # Ignore sub-0.05 ms phases, their p95 is mostly timer noise
+            limit = max(base_stats["p95_ms"] * (1 + tolerance), 0.05)
+            if stats["p95_ms"] > limit:
+                regressions.append(
+                    f"{name}: {phase} p95 {stats['p95_ms']:.3f} ms > baseline {base_stats['p95_ms']:.3f} ms"
+                )
+    return regressions
+
+
+def print_report(name, result):
+    print(f"\n== {name}: {result['description']}")
+    print(f"   {result['ticks']} ticks, {result['ticks_per_sec']:.1f} ticks/sec, "
+          f"{result['enemies_left']} enemies left")
+    print(f"   {'phase':<12} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'mean ms':>9}")
+    for phase, stats in result["phases"].items():
+        print(f"   {phase:<12} {stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f} "
+              f"{stats['p99_ms']:>9.3f} {stats['mean_ms']:>9.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run simulation benchmark scenarios")
+    parser.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--ticks", type=int, help="override the number of measured ticks")
+    parser.add_argument("--draw", action="store_true", help="also time on_draw in a hidden window")
+    parser.add_argument("--enemy-store", action="store_true", help="run with the NumPy enemy store")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--require-baseline", action="store_true",
+                        help="fail instead of passing when there is no baseline (for CI)")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed slowdown (0.15 = 15%%)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    if args.draw:
+        import arcade
+        arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, visible=False)
+
+    # Keep game log output out of the timings and the report
+    event_log.configure(level="warning", echo_level="error")
+    results = {}
+    for name in args.scenario or sorted(SCENARIOS):
+        results[name] = run_scenario(SCENARIOS[name], args.ticks, args.draw, args.enemy_store)
+        print_report(name, results[name])
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 1 if args.require_baseline else 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nPERFORMANCE REGRESSION:")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+
+    print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+from core.LevelData import LevelData
+
+FIRST_ROUND_MAP = "assets/maps/first_round_map_obj.tmx"
+
+# A single empty wave keeps the wave timer from spawning on its own,
+# so scenarios control exactly how many enemies are on the map
+NO_WAVES = [{"enemy": "grunt", "count": 0, "spawn_rate": 1.0}]
+
+
+class Scenario:
+    """A named, reproducible load on the simulation used by the benchmark runner"""
+
+    def __init__(self, name, description, map_path=FIRST_ROUND_MAP, towers=0, tower_type="basic",
+                 tower_level=1, upgrade_path="damage", enemies=0, waves=None, ticks=600):
+        self.name = name
+        self.description = description
+        self.map_path = map_path
+        self.towers = towers
+        self.tower_type = tower_type
+        self.tower_level = tower_level
+        self.upgrade_path = upgrade_path
+        self.enemies = enemies
+        self.waves = waves or NO_WAVES
+        self.ticks = ticks
+
+    def level_data(self):
+        return LevelData(self.map_path, waves=self.waves, money_start=0, lives=10 ** 9)
+
+    def populate(self, sim):
+        """Place the scenario's towers and enemies into a fresh simulation"""
+        path = sim.path_table
+
+        # Towers are spread evenly along the path, alternating sides, and are free
+        for n, distance in enumerate(spaced_distances(path, self.towers)):
+            x, y = path.position(distance)
+            ux, uy = path.direction(distance)
+            side = 40 if n % 2 == 0 else -40
+            sim.money += 10 ** 6
+            tower = sim.place_tower(self.tower_type, x - uy * side, y + ux * side)
+            while tower.level < self.tower_level and tower.upgrade(self.upgrade_path):
+                pass
+        sim.money = 0
+
+        # Enemies start spread out over the whole path instead of stacked on the spawn
+        for distance in spaced_distances(path, self.enemies):
+            enemy = sim.spawn_enemy()
+            enemy.distance = enemy.prev_distance = distance
+            enemy.center_x, enemy.center_y = path.position(distance)
+
+
+def spaced_distances(path_table, count):
+    """Return count distances evenly spaced along a path"""
+    spacing = path_table.total_length / count if count > 0 else 0.0
+    return [(n + 0.5) * spacing for n in range(count)]
+
+
+SCENARIOS = {
+    scenario.name: scenario for scenario in [
+        Scenario(
+            "towers50_vs_skeletons2000",
+            "50 towers vs 2,000 skeletons on first_round_map_obj.tmx",
+            towers=50, enemies=2000,
+        ),
+        Scenario(
+            "max_level_sniper_spam",
+            "40 max-level sniper towers vs 500 skeletons",
+            towers=40, tower_type="sniper", tower_level=7, enemies=500,
+        ),
+        Scenario(
+            "spawn_stream",
+            "Wave timer spawning 600 skeletons at 0.01 s intervals into 10 towers",
+            towers=10, waves=[{"enemy": "grunt", "count": 600, "spawn_rate": 0.01}],
+        ),
+        Scenario(
+            "idle_towers",
+            "20 towers on an empty map (fixed per-tick overhead)",
+            towers=20,
+        ),
+    ]
+}
@@ -0,0 +1,167 @@
+"""Monte Carlo odds of tower upgrade paths and the gamble wheel.
+
+Usage (from the repository root):
+
+    python -m benchmarks.upgrade_odds                          # every path for a basic tower
+    python -m benchmarks.upgrade_odds -t sniper -p gamble -p wheel -n 5000000
+    python -m benchmarks.upgrade_odds --json odds.json
+
+Each path plays all of its sample sequences at once as NumPy arrays, one
+array per stat, applying the same effect tables the game uses
+(tower_code/upgrade_rules.py and the GAMBLE_WHEEL in core/gamble.py), so
+the odds follow any balance change without being kept in sync by hand.
+
+The damage/speed/range/gamble paths upgrade from --level to the max level,
+starting from the stats that path gives at --level. "wheel" spins the
+gamble wheel --spins times on a level 1 tower; a spin costs the upgrade
+price and FREE refunds it. For every step the report gives the
+mean and variance of each stat and of its gain per coin spent (over the
+sequences that have spent anything).
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from core.gamble import GAMBLE_OUTCOMES, GAMBLE_WEIGHTS, GAMBLE_WHEEL, REFUND_OUTCOME
+from tower_code.tower_stats import base_stats
+from tower_code.upgrade_rules import MAX_LEVEL, UPGRADE_GAMBLE_ROLLS, UPGRADE_PATHS, upgrade_cost
+
+STATS = ("damage", "range", "attack_speed")
+PATHS = (*UPGRADE_PATHS, "gamble", "wheel")
+
+
+def sample_outcomes(rng, weights, size):
+    """Indices into weights, drawn with those relative weights by a NumPy Generator"""
+    weights = np.asarray(weights, dtype=float)
+    return rng.choice(len(weights), size=size, p=weights / weights.sum())
+
+
+def apply_effects_array(stats, effects, mask=None):
+    """apply_effects over arrays of stats, only where mask is set if one is given"""
+    for stat, multiplier, addend, floor in effects:
+        values = stats[stat] * multiplier + addend
+        if floor is not None:
+            np.maximum(values, floor, out=values)
+        stats[stat] = values if mask is None else np.where(mask, values, stats[stat])
+
+
+def apply_rolls(stats, table, rolls):
+    """Apply each sequence's roll, given as indices into an outcome -> (weight, effects) table"""
+    for index, (_, effects) in enumerate(table.values()):
+        if effects:
+            apply_effects_array(stats, effects, rolls == index)
+
+
+def summarize(values):
+    return {"mean": float(values.mean()), "var": float(values.var())}
+
+
+def upgrade_step(stats, path, rng, samples):
+    """One upgrade along a damage/speed/range/gamble path for every sequence"""
+    if path == "gamble":
+        weights = [weight for weight, _ in UPGRADE_GAMBLE_ROLLS.values()]
+        apply_rolls(stats, UPGRADE_GAMBLE_ROLLS, sample_outcomes(rng, weights, samples))
+    else:
+        apply_effects_array(stats, UPGRADE_PATHS[path])
+
+
+def simulate(tower_type, path, samples, rng, level=1, spins=MAX_LEVEL - 1):
+    """Play samples upgrade sequences of one path at once. Returns a summary per step.
+
+    Starting above level 1, the tower first takes the path's earlier
+    upgrades (unpaid), and gains are measured from those starting stats.
+    The wheel only runs from level 1, since its starting stats would depend
+    on whichever path got the tower higher.
+    """
+    if path not in PATHS:
+        raise ValueError(f"Unknown upgrade path {path!r}")
+    if path == "wheel" and level != 1:
+        raise ValueError("The wheel is only simulated from level 1")
+    base = base_stats(tower_type)
+    stats = {stat: np.full(samples, float(base[stat])) for stat in STATS}
+    if path != "wheel":
+        for _ in range(level - 1):
+            upgrade_step(stats, path, rng, samples)
+    start = {stat: values.copy() for stat, values in stats.items()}
+    spent = np.zeros(samples)
+    steps = spins if path == "wheel" else MAX_LEVEL - level
+    refund_index = GAMBLE_OUTCOMES.index(REFUND_OUTCOME)
+
+    summaries = []
+    for step in range(1, steps + 1):
+        if path == "wheel":
+            rolls = sample_outcomes(rng, GAMBLE_WEIGHTS, samples)
+            apply_rolls(stats, GAMBLE_WHEEL, rolls)
+            spent += np.where(rolls == refund_index, 0, upgrade_cost(level))
+        else:
+            spent += upgrade_cost(level + step - 1)
+            upgrade_step(stats, path, rng, samples)
+
+        paid = spent > 0
+        summary = {
+            "step": step,
+            "level": level if path == "wheel" else level + step,
+            "spent": summarize(spent),
+            "stats": {},
+        }
+        for stat in STATS:
+            gain = stats[stat] - start[stat]
+            summary["stats"][stat] = {
+                **summarize(stats[stat]),
+                "per_coin": summarize(gain[paid] / spent[paid]) if paid.any() else None,
+            }
+        summaries.append(summary)
+    return summaries
+
+
+def print_report(report, samples):
+    for path, summaries in report.items():
+        label = "spins" if path == "wheel" else "level"
+        print(f"\n== {path} ({samples:,} sequences)")
+        print(f"   {label:>5} {'spent $':>8}" + "".join(
+            f" {stat + ' mean':>18} {'var':>10} {'per $':>8}" for stat in STATS))
+        for summary in summaries:
+            step = summary["step"] if path == "wheel" else summary["level"]
+            row = f"   {step:>5} {summary['spent']['mean']:>8.1f}"
+            for stat in STATS:
+                values = summary["stats"][stat]
+                per_coin = values["per_coin"]["mean"] if values["per_coin"] else float("nan")
+                row += f" {values['mean']:>18.2f} {values['var']:>10.2f} {per_coin:>8.4f}"
+            print(row)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Expected value and variance of tower upgrade paths")
+    parser.add_argument("-t", "--tower", default="basic", help="tower type")
+    parser.add_argument("-p", "--path", action="append", choices=PATHS, help="path (repeatable, default: all)")
+    parser.add_argument("-n", "--samples", type=int, default=1_000_000, help="sequences per path")
+    parser.add_argument("--level", type=int, default=1, help="tower level to start from")
+    parser.add_argument("--spins", type=int, default=MAX_LEVEL - 1, help="gamble wheel spins to play")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write the full report to this file")
+    args = parser.parse_args(argv)
+    if not 1 <= args.level < MAX_LEVEL:
+        parser.error(f"--level must be between 1 and {MAX_LEVEL - 1}")
+    if args.level > 1 and args.path and "wheel" in args.path:
+        parser.error("the wheel is only simulated from level 1")
+    paths = args.path or [path for path in PATHS if path != "wheel" or args.level == 1]
+
+    rng = np.random.default_rng(args.seed)
+    started = time.perf_counter()
+    report = {path: simulate(args.tower, path, args.samples, rng, args.level, args.spins)
+              for path in paths}
+
+    print_report(report, args.samples)
+    print(f"\n{args.samples * len(report):,} sequences in {time.perf_counter() - started:.1f} s")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"tower": args.tower, "level": args.level, "samples": args.samples,
+                       "seed": args.seed, "paths": report}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,33 @@
+import arcade
+from core.text_layer import TextLayer
+
+
+class FastForwardButton:
+    def __init__(self, x, y, speed_control, width=80, height=40):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.speed_control = speed_control
+        self.text = TextLayer()
+
+    def draw(self):
+        """Draw the fast-forward button with the current speed"""
+        arcade.draw_lbwh_rectangle_filled(self.x, self.y, self.width, self.height, arcade.color.DARK_GRAY)
+        arcade.draw_lbwh_rectangle_outline(self.x, self.y, self.width, self.height,
+                                           arcade.color.WHITE, border_width=2)
+
+        # Yellow while the frame budget is holding the speed below the chosen one
+        color = arcade.color.YELLOW if self.speed_control.throttled else arcade.color.WHITE
+        self.text.draw_text("speed", f"{self.speed_control.multiplier}x", self.x + self.width / 2,
+                            self.y + self.height / 2, color, 16, anchor_x="center", anchor_y="center")
+        self.text.draw()
+
+    def check_click(self, x, y):
+        """Check if the button was clicked"""
+        return (self.x <= x <= self.x + self.width and
+                self.y <= y <= self.y + self.height)
+
+    def click(self):
+        """Step to the next speed setting"""
+        return self.speed_control.cycle()
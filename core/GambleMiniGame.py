@@ -1,7 +1,8 @@
 import arcade
-import random
 import math
 from core.constants import *
+from core.gamble import wheel_segments
+from core.text_layer import TextLayer
 
 class GambleMiniGame:
     def __init__(self, screen_width, screen_height, ui_bar_height):
@@ -14,25 +15,31 @@ class GambleMiniGame:
         self.center_x = screen_width // 2
         self.center_y = screen_height // 2
         self.tower = None
-        self.money_ref = None  # Reference to money variable
         self.result = None
         self.spinning = False
         self.spin_timer = 0
         self.spin_angle = 0
+        self.spin_start_angle = 0
+        self.spin_target_angle = 0
+        # Segments are sized by the outcome weights the simulation rolls with
+        colors = {
+            "DOUBLE": arcade.color.GREEN,
+            "HALF": arcade.color.RED,
+            "NOTHING": arcade.color.GRAY,
+            "FREE": arcade.color.BLUE,
+            "MAX": arcade.color.GOLD,
+        }
         self.wheel_options = [
-            {"text": "DOUBLE", "color": arcade.color.GREEN, "angle": 0, "weight": 0.2},
-            {"text": "HALF", "color": arcade.color.RED, "angle": 72, "weight": 0.3},
-            {"text": "NOTHING", "color": arcade.color.GRAY, "angle": 144, "weight": 0.3},
-            {"text": "FREE", "color": arcade.color.BLUE, "angle": 216, "weight": 0.15},
-            {"text": "MAX", "color": arcade.color.GOLD, "angle": 288, "weight": 0.05}
+            {"text": outcome, "color": colors[outcome], "angle": start, "sweep": sweep}
+            for outcome, start, sweep in wheel_segments()
         ]
         self.selected_option = None
         self.animation_phase = 0  # 0=waiting, 1=spinning, 2=result
+        self.text = TextLayer()
         
-    def show(self, tower, money_ref):
+    def show(self, tower):
         """Show the gamble minigame"""
         self.tower = tower
-        self.money_ref = money_ref
         self.visible = True
         self.result = None
         self.spinning = False
@@ -44,94 +51,38 @@ class GambleMiniGame:
         """Hide the minigame"""
         self.visible = False
         self.tower = None
-        self.money_ref = None
         self.result = None
-        
-    def spin(self):
-        """Start the spin animation"""
+            
+    def spin(self, result):
+        """Start the spin animation towards an outcome already rolled by the simulation"""
         if not self.spinning and self.animation_phase == 0:
             self.spinning = True
             self.animation_phase = 1
             self.spin_timer = 0
             self.result = None
-            self.selected_option = None
+            self.selected_option = next(option for option in self.wheel_options if option["text"] == result)
+            # A few full turns, ending with the middle of the outcome's segment under the pointer (90°)
+            middle = self.selected_option["angle"] + self.selected_option["sweep"] / 2
+            self.spin_start_angle = self.spin_angle
+            self.spin_target_angle = self.spin_angle + 360 * 6 + (90 - middle - self.spin_angle) % 360
             
     def update(self, delta_time):
         """Update minigame animation"""
         if self.spinning:
             self.spin_timer += delta_time
-            self.spin_angle += delta_time * 720  # Spin speed
-            
-            # Slow down after 2 seconds
-            if self.spin_timer >= 2.0:
-                spin_speed = max(10, 720 * (1 - (self.spin_timer - 2.0) * 2))
-                self.spin_angle += delta_time * spin_speed
+            # Ease out over 3 seconds so the wheel slows down onto the result
+            t = min(self.spin_timer / 3.0, 1.0)
+            eased = 1 - (1 - t) ** 3
+            self.spin_angle = self.spin_start_angle + (self.spin_target_angle - self.spin_start_angle) * eased
                 
-                # Stop spinning after 3 seconds
-                if self.spin_timer >= 3.0:
-                    self.spinning = False
-                    self.determine_result()
-                    self.animation_phase = 2
-                    
-    def determine_result(self):
-        """Determine the random result based on wheel position"""
-        # Get final angle (normalized to 0-360)
-        final_angle = self.spin_angle % 360
-        
-        # Find which segment the pointer landed on
-        for option in self.wheel_options:
-            segment_start = option["angle"]
-            segment_end = (option["angle"] + 72) % 360
-            
-            if segment_start <= segment_end:
-                if segment_start <= final_angle < segment_end:
-                    self.selected_option = option
-                    break
-            else:  # Handle wrap-around
-                if final_angle >= segment_start or final_angle < segment_end:
-                    self.selected_option = option
-                    break
-        
-        if self.selected_option:
-            self.result = self.selected_option["text"]
-            self.apply_result()
-            
-    def apply_result(self):
-        """Apply the gamble result to the tower"""
-        if self.result == "DOUBLE":
-            # Double all stats
-            self.tower.properties["damage"] *= 2
-            self.tower.properties["range"] *= 2
-            self.tower.properties["attack_speed"] *= 2
-            print("🎉 DOUBLE! All stats doubled!")
-            
-        elif self.result == "HALF":
-            # Halve all stats
-            self.tower.properties["damage"] *= 0.5
-            self.tower.properties["range"] *= 0.5
-            self.tower.properties["attack_speed"] *= 0.5
-            print("💔 HALF! All stats halved!")
-            
-        elif self.result == "NOTHING":
-            # No change
-            print("😐 NOTHING! No changes made.")
-            
-        elif self.result == "FREE":
-            # Free upgrade, refund money
-            refund = self.tower.get_upgrade_cost()
-            self.money_ref[0] += refund  # Refund the cost
-            print(f"🎁 FREE! ${refund} refunded!")
-            
-        elif self.result == "MAX":
-            # Max out the tower (simplified)
-            bonus = 5
-            self.tower.properties["damage"] += bonus
-            self.tower.properties["range"] += bonus * 20
-            self.tower.properties["attack_speed"] += bonus * 0.5
-            print(f"🔥 MAX! +{bonus} to all stats!")
+            # Stop spinning after 3 seconds
+            if self.spin_timer >= 3.0:
+                self.spinning = False
+                self.result = self.selected_option["text"]
+                self.animation_phase = 2
     
     def check_click(self, x, y):
-        """Check if spin button was clicked"""
+        """Check if the spin button was clicked while the wheel is ready to spin"""
         if not self.visible:
             return False
             
@@ -143,9 +94,7 @@ class GambleMiniGame:
         
         if (spin_button_x - spin_button_width//2 <= x <= spin_button_x + spin_button_width//2 and
             spin_button_y - spin_button_height//2 <= y <= spin_button_y + spin_button_height//2):
-            if self.animation_phase == 0:  # Only allow click if not spinning
-                self.spin()
-                return True
+            return self.animation_phase == 0  # Only allow click if not spinning
                 
         return False
         
@@ -180,7 +129,8 @@ class GambleMiniGame:
         )
         
         # Draw title
-        arcade.draw_text(
+        self.text.draw_text(
+            "title",
             "🎲 GAMBLE MINIGAME 🎲",
             self.center_x,
             self.center_y + self.height // 2 - 30,
@@ -200,22 +150,23 @@ class GambleMiniGame:
             angle = option["angle"] + self.spin_angle
             arcade.draw_arc_filled(
                 wheel_x, wheel_y, wheel_radius, wheel_radius,
-                option["color"], angle, angle + 72, 0
+                option["color"], angle, angle + option["sweep"], 0
             )
             
             # Draw segment text
-            text_angle = math.radians(angle + 36)
+            text_angle = math.radians(angle + option["sweep"] / 2)
             text_x = wheel_x + math.cos(text_angle) * wheel_radius * 0.7
             text_y = wheel_y + math.sin(text_angle) * wheel_radius * 0.7
             
-            arcade.draw_text(
+            self.text.draw_text(
+                ("segment", option["text"]),
                 option["text"],
                 text_x, text_y,
                 arcade.color.WHITE,
                 12,
                 anchor_x="center",
                 anchor_y="center",
-                rotation=angle + 36
+                rotation=angle + option["sweep"] / 2
             )
         
         # Draw wheel center and pointer
@@ -234,7 +185,8 @@ class GambleMiniGame:
         )
         
         button_text = "SPIN" if self.animation_phase == 0 else "SPINNING..." if self.animation_phase == 1 else "SPIN AGAIN"
-        arcade.draw_text(
+        self.text.draw_text(
+            "button",
             button_text,
             self.center_x, self.center_y - 100,
             arcade.color.WHITE,
@@ -251,7 +203,8 @@ class GambleMiniGame:
             elif self.result == "NOTHING":
                 result_color = arcade.color.GRAY
                 
-            arcade.draw_text(
+            self.text.draw_text(
+                "result",
                 f"RESULT: {self.result}",
                 self.center_x,
                 self.center_y - 150,
@@ -262,11 +215,14 @@ class GambleMiniGame:
             )
             
             # Draw instructions to continue
-            arcade.draw_text(
+            self.text.draw_text(
+                "continue",
                 "Click anywhere to continue",
                 self.center_x,
                 self.center_y - 180,
                 arcade.color.WHITE,
                 16,
                 anchor_x="center"
-            )
\ No newline at end of file
+            )
+
+        self.text.draw()
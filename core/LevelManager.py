@@ -13,7 +13,7 @@ class LevelManager():
                 lives= 10
             ), 
             2: LevelData(
-                "assets\maps\second_round_map.tmx",
+                "assets/maps/second_round_map.tmx",
                 waves=[
                     {"enemy": "grunt", "count": 15, "spawn_rate": 0.9},
                     {"enemy": "tank", "count": 3, "spawn_rate": 2.0}
@@ -1,6 +1,7 @@
 # core/MainMenu.py
 import arcade
 from core.constants import *
+from core.text_layer import TextLayer
 
 class MainMenu(arcade.View):
     def __init__(self):
@@ -9,14 +10,15 @@ class MainMenu(arcade.View):
             {"text": "Start Game", "y": 400, "width": 300, "height": 60, "action": "level_select"},
             {"text": "Quit", "y": 300, "width": 300, "height": 60, "action": "quit"}
         ]
+        self.text = TextLayer()
         
     def on_show(self):
         arcade.set_background_color(arcade.color.DARK_BLUE_GRAY)
         
     def on_draw(self):
         self.clear()
-        arcade.draw_text("GAMBLING TOWER DEFENSE", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100,
-                        arcade.color.WHITE, font_size=50, anchor_x="center")
+        self.text.draw_text("title", "GAMBLING TOWER DEFENSE", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100,
+                            arcade.color.WHITE, font_size=50, anchor_x="center")
         
         for button in self.buttons:
             left = SCREEN_WIDTH // 2 - button["width"] // 2
@@ -25,10 +27,11 @@ class MainMenu(arcade.View):
             arcade.draw_lbwh_rectangle_filled(
                 left, bottom, button["width"], button["height"], arcade.color.DARK_GREEN
             )
-            arcade.draw_text(
-                button["text"], SCREEN_WIDTH // 2, button["y"],
+            self.text.draw_text(
+                ("button", button["action"]), button["text"], SCREEN_WIDTH // 2, button["y"],
                 arcade.color.WHITE, font_size=30, anchor_x="center", anchor_y="center"
             )
+        self.text.draw()
     
     def on_mouse_press(self, x, y, button, modifiers):
         for btn in self.buttons:
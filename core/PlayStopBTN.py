@@ -1,4 +1,5 @@
 import arcade
+from core.text_layer import TextLayer
 
 class PlayPauseButton:
     def __init__(self, x, y, width=80, height=40):
@@ -7,6 +8,7 @@ class PlayPauseButton:
         self.width = width
         self.height = height
         self.is_paused = False
+        self.text = TextLayer()
         
     def draw(self):
         """Draw the play/pause button"""
@@ -42,12 +44,13 @@ class PlayPauseButton:
                 arcade.color.GREEN            # color
             )
             # Draw "PAUSED" text above button
-            arcade.draw_text("PAUSED", center_x - 30, self.y + self.height + 10, 
-                           arcade.color.RED, 16)
+            self.text.draw_text("paused", "PAUSED", center_x - 30, self.y + self.height + 10,
+                                arcade.color.RED, 16)
         else:
             # Draw pause icon (two vertical bars)
             arcade.draw_lbwh_rectangle_filled(center_x - 8, center_y, 6, 20, arcade.color.RED)
             arcade.draw_lbwh_rectangle_filled(center_x + 8, center_y, 6, 20, arcade.color.RED)
+        self.text.draw()
     
     def check_click(self, x, y):
         """Check if the button was clicked"""
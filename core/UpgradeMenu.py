@@ -1,4 +1,7 @@
 import arcade
+from core.asset_cache import asset_cache
+from core.event_log import event_log
+from core.text_layer import TextLayer
 
 class UpgradeMenu:
     def __init__(self, screen_width, screen_height, ui_bar_height):
@@ -13,6 +16,7 @@ class UpgradeMenu:
         self.selected_tower = None
         self.animation_speed = 15
         self.tower_sprite = None
+        self.text = TextLayer()
         
         # Create buttons
         self.upgrade_button = {
@@ -47,17 +51,18 @@ class UpgradeMenu:
             # Fallback if scale attribute doesn't exist
             self.tower_scale = 0.8  # Reduced from 1.5
         
-        print(f"Tower scale: {tower.scale} (type: {type(tower.scale)})")
-        print(f"Menu scale: {self.tower_scale}")
+        event_log.debug("ui", "Tower scale: %s (type: %s)", tower.scale, type(tower.scale))
+        event_log.debug("ui", "Menu scale: %s", self.tower_scale)
         
         # Create the sprite for the menu
-        try:
-            self.tower_sprite = arcade.Sprite(self.tower_image_path, self.tower_scale)
-            print(f"Loaded sprite from: {self.tower_image_path}")
-        except Exception as e:
-            print(f"Error loading sprite {self.tower_image_path}: {e}")
+        texture = asset_cache.get_texture(self.tower_image_path)
+        if texture:
+            self.tower_sprite = arcade.Sprite(texture, self.tower_scale)
+            event_log.debug("ui", "Loaded sprite from: %s", self.tower_image_path)
+        else:
+            event_log.warning("ui", "Error loading sprite %s", self.tower_image_path)
             # Fallback: use a default sprite
-            self.tower_sprite = arcade.Sprite(":resources:images/items/coinGold.png", 0.5)
+            self.tower_sprite = arcade.Sprite(asset_cache.get_texture(":resources:images/items/coinGold.png"), 0.5)
         
         self.visible = True
         self.target_x = self.screen_width - self.width
@@ -114,7 +119,8 @@ class UpgradeMenu:
             # Draw tower info below the sprite
             info_y_start = self.screen_height - 120
             
-            arcade.draw_text(
+            self.text.draw_text(
+                "name",
                 f"{self.selected_tower.tower_type.capitalize()} Tower",
                 self.current_x + 20,
                 info_y_start,
@@ -122,7 +128,8 @@ class UpgradeMenu:
                 20
             )
             
-            arcade.draw_text(
+            self.text.draw_text(
+                "level",
                 f"Level: {self.selected_tower.level}/{self.selected_tower.max_level}",
                 self.current_x + 20,
                 info_y_start - 30,
@@ -130,7 +137,8 @@ class UpgradeMenu:
                 16
             )
             
-            arcade.draw_text(
+            self.text.draw_text(
+                "damage",
                 f"Damage: {self.selected_tower.properties['damage']}",
                 self.current_x + 20,
                 info_y_start - 60,
@@ -138,7 +146,8 @@ class UpgradeMenu:
                 16
             )
             
-            arcade.draw_text(
+            self.text.draw_text(
+                "range",
                 f"Range: {self.selected_tower.properties['range']}",
                 self.current_x + 20,
                 info_y_start - 90,
@@ -146,7 +155,8 @@ class UpgradeMenu:
                 16
             )
             
-            arcade.draw_text(
+            self.text.draw_text(
+                "speed",
                 f"Speed: {self.selected_tower.properties['attack_speed']:.1f}/s",
                 self.current_x + 20,
                 info_y_start - 120,
@@ -173,7 +183,8 @@ class UpgradeMenu:
                     button_color
                 )
                 
-                arcade.draw_text(
+                self.text.draw_text(
+                    "upgrade",
                     f"Upgrade (${upgrade_cost})",
                     self.current_x + 40,
                     button_y_start - 25,
@@ -184,7 +195,8 @@ class UpgradeMenu:
                 # Show next level stats preview
                 next_stats = self.selected_tower.get_next_level_stats()
                 if next_stats:
-                    arcade.draw_text(
+                    self.text.draw_text(
+                        "next_stats",
                         f"Next: Dmg:{next_stats['damage']} Rng:{next_stats['range']}",
                         self.current_x + 20,
                         button_y_start - 70,
@@ -197,7 +209,8 @@ class UpgradeMenu:
                     self.current_x + 25, upgrade_bottom, 200, 50, arcade.color.GRAY
                 )
                 
-                arcade.draw_text(
+                self.text.draw_text(
+                    "max_level",
                     "MAX LEVEL REACHED",
                     self.current_x + 30,
                     upgrade_bottom + 25, 
@@ -205,14 +218,15 @@ class UpgradeMenu:
                     16
                 )
             else:
-                print("DEBUG: Tower exists but cannot be upgraded yet")
+                event_log.debug("ui", "Tower exists but cannot be upgraded yet")
                 # DON'T DRAW ANYTHING HERE or draw a disabled button
                 # This prevents the max level text from appearing when it shouldn't
                 arcade.draw_lbwh_rectangle_filled(
                     self.current_x + 25, button_y_start - 50, 200, 50, arcade.color.DARK_GRAY
                 )
                 
-                arcade.draw_text(
+                self.text.draw_text(
+                    "cannot_upgrade",
                     "Cannot Upgrade Yet",
                     self.current_x + 40,
                     button_y_start - 25,
@@ -231,7 +245,8 @@ class UpgradeMenu:
                 arcade.color.ORANGE
             )
             
-            arcade.draw_text(
+            self.text.draw_text(
+                "sell",
                 f"Sell (${sell_value})",
                 self.current_x + 60,
                 button_y_start - 85,
@@ -248,13 +263,16 @@ class UpgradeMenu:
                 arcade.color.DARK_BLUE
             )
             
-            arcade.draw_text(
+            self.text.draw_text(
+                "close",
                 "Close",
                 self.current_x + 85,
                 button_y_start - 155,
                 arcade.color.WHITE,
                 16
             )
+
+        self.text.draw()
     
     def check_click(self, x, y):
         """Check if any menu button was clicked"""
@@ -277,7 +295,7 @@ class UpgradeMenu:
             upgrade_top = button_y_start
             if (25 <= menu_x <= 225 and 
                 upgrade_bottom <= y <= upgrade_top):
-                print(f"Click in upgrade area: {25 <= menu_x <= 225 and upgrade_bottom <= y <= upgrade_top}")
+                event_log.debug("ui", "Click in upgrade area at (%s, %s)", menu_x, y)
                 return "upgrade"
         
         # Check sell button
@@ -1,4 +1,9 @@
 import arcade
+from core.asset_cache import asset_cache
+from core.gamble import GAMBLE_WHEEL
+from core.text_layer import TextLayer
+from tower_code.targeting import TARGETING_MODES
+from tower_code.upgrade_rules import apply_effects
 
 class UpgradePathMenu:
     def __init__(self, screen_width, screen_height, ui_bar_height):
@@ -13,6 +18,8 @@ class UpgradePathMenu:
         self.selected_tower = None
         self.animation_speed = 15
         self.tower_sprite = None
+        self.stat_previews = {}
+        self.text = TextLayer()
         
         # Upgrade paths with descriptions
         self.paths = [
@@ -22,16 +29,26 @@ class UpgradePathMenu:
             {"name": "Gamble", "key": "gamble", "color": arcade.color.PURPLE, "description": "Random risky upgrade"}
         ]
 
+        # Row of targeting mode buttons under the tower info
+        self.targeting_labels = {"first": "First", "last": "Last", "strongest": "Strong",
+                                 "weakest": "Weak", "closest": "Close"}
+        self.targeting_button_width = 300 // len(TARGETING_MODES)
+        self.targeting_button_height = 26
+
     def show(self, tower):
         """Show the upgrade path menu"""
         self.selected_tower = tower
         self.tower_image_path = tower.image_path
         self.tower_scale = 0.5  # Reduced from 1.2 to 0.5
         
-        try:
-            self.tower_sprite = arcade.Sprite(self.tower_image_path, self.tower_scale)
-        except:
-            self.tower_sprite = arcade.Sprite(":resources:images/items/coinGold.png", 0.5)
+        texture = asset_cache.get_texture(self.tower_image_path)
+        if texture:
+            self.tower_sprite = arcade.Sprite(texture, self.tower_scale)
+        else:
+            self.tower_sprite = arcade.Sprite(asset_cache.get_texture(":resources:images/items/coinGold.png"), 0.5)
+
+        # Worked out here rather than per frame; show() is called again after every upgrade
+        self.stat_previews = self.build_stat_previews(tower)
         
         self.visible = True
         self.target_x = self.screen_width - self.width
@@ -78,18 +95,35 @@ class UpgradePathMenu:
             self.tower_sprite.center_y = self.screen_height - 80
             arcade.draw_sprite(self.tower_sprite)
 
-            arcade.draw_text(
+            self.text.draw_text(
+                "name",
                 f"{self.selected_tower.tower_type.capitalize()} Tower",
                 self.current_x + 20, self.screen_height - 120,
                 arcade.color.WHITE, 20
             )
 
-            arcade.draw_text(
+            self.text.draw_text(
+                "level",
                 f"Level: {self.selected_tower.level}/{self.selected_tower.max_level}",
                 self.current_x + 20, self.screen_height - 150,
                 arcade.color.WHITE, 16
             )
 
+            # --- Draw targeting mode buttons ---
+            row_bottom = self.targeting_row_bottom()
+            for i, mode in enumerate(TARGETING_MODES):
+                left = self.current_x + 25 + i * self.targeting_button_width
+                selected = mode == self.selected_tower.targeting
+                arcade.draw_lbwh_rectangle_filled(
+                    left + 1, row_bottom, self.targeting_button_width - 2, self.targeting_button_height,
+                    arcade.color.STEEL_BLUE if selected else arcade.color.DIM_GRAY
+                )
+                self.text.draw_text(
+                    ("targeting", mode),
+                    self.targeting_labels[mode], left + self.targeting_button_width / 2, row_bottom + 8,
+                    arcade.color.WHITE, 11, anchor_x="center", bold=selected
+                )
+
             # --- Draw upgrade path buttons ---
             button_area_height = self.height - 200
             button_spacing = button_area_height // len(self.paths)
@@ -108,34 +142,75 @@ class UpgradePathMenu:
                 )
 
                 # Path name
-                arcade.draw_text(
+                self.text.draw_text(
+                    ("path_name", i),
                     path["name"], self.current_x + 40, path_y,
                     arcade.color.WHITE, 20
                 )
 
                 # Cost
-                arcade.draw_text(
+                self.text.draw_text(
+                    ("path_cost", i),
                     f"${upgrade_cost}", self.current_x + 240, path_y,
                     arcade.color.WHITE, 18
                 )
 
                 # Description
-                arcade.draw_text(
+                self.text.draw_text(
+                    ("path_description", i),
                     path["description"], self.current_x + 40, path_y - 20,
                     arcade.color.LIGHT_GRAY, 12
                 )
 
                 # Stat preview
-                next_stats = self.selected_tower.get_next_level_stats(path["key"])
-                if next_stats:
-                    stats_text = (f"Dmg:{next_stats['damage']}  "
-                                f"Rng:{next_stats['range']}  "
-                                f"Spd:{next_stats['attack_speed']:.2f}")
-                    arcade.draw_text(
+                stats_text = self.stat_previews.get(path["key"])
+                if stats_text:
+                    self.text.draw_text(
+                        ("path_stats", i),
                         stats_text, self.current_x + 40, path_y - 35,
                         arcade.color.WHITE, 10
                     )
+
+        self.text.draw()
     
+    def build_stat_previews(self, tower):
+        """Path key -> the stat line shown under its button"""
+        previews = {}
+        for path in self.paths:
+            if path["key"] == "gamble":
+                # The button spins the wheel, so show the range of stats it can land on
+                outcomes = []
+                for _, effects in GAMBLE_WHEEL.values():
+                    stats = tower.properties.copy()
+                    apply_effects(stats, effects)
+                    outcomes.append(stats)
+                low = {stat: min(stats[stat] for stats in outcomes) for stat in ("damage", "range", "attack_speed")}
+                high = {stat: max(stats[stat] for stats in outcomes) for stat in ("damage", "range", "attack_speed")}
+                previews["gamble"] = (f"Dmg:{low['damage']:g}-{high['damage']:g}  "
+                                      f"Rng:{low['range']:g}-{high['range']:g}  "
+                                      f"Spd:{low['attack_speed']:.2f}-{high['attack_speed']:.2f}")
+            else:
+                next_stats = tower.get_next_level_stats(path["key"])
+                previews[path["key"]] = (f"Dmg:{next_stats['damage']}  "
+                                         f"Rng:{next_stats['range']}  "
+                                         f"Spd:{next_stats['attack_speed']:.2f}")
+        return previews
+
+    def targeting_row_bottom(self):
+        return self.screen_height - 193
+
+    def check_targeting_click(self, x, y):
+        """Return the targeting mode whose button was clicked, or None"""
+        if not self.visible or self.current_x >= self.screen_width or not self.selected_tower:
+            return None
+        row_bottom = self.targeting_row_bottom()
+        if not row_bottom <= y <= row_bottom + self.targeting_button_height:
+            return None
+        index = int((x - self.current_x - 25) // self.targeting_button_width)
+        if x < self.current_x + 25 or index >= len(TARGETING_MODES):
+            return None
+        return TARGETING_MODES[index]
+
     def check_click(self, x, y):
         """Check if any path button was clicked"""
         # Change visibility check for right-side positioning
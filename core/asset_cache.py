@@ -0,0 +1,80 @@
+import threading
+
+import arcade
+
+
+class AssetCache:
+    """Process-wide cache of decoded textures and sprite sheet frames.
+
+    Entries are keyed by (path, grid spec) so each file is read and decoded
+    once, and every caller gets the same shared texture objects back. The
+    level preloader fills it from a worker thread, so lookups, loads and the
+    counters all happen under one lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+
+    def get_texture(self, path):
+        """Return the texture for a single image, or None if it can't be loaded"""
+        return self._get((path, None), lambda: arcade.load_texture(path))
+
+    def get_texture_grid(self, path, size, columns, count):
+        """Return a shared tuple of frames cut from a sprite sheet, or None if it can't be loaded"""
+        def load():
+            sheet = arcade.load_spritesheet(path)
+            return tuple(sheet.get_texture_grid(size=size, columns=columns, count=count))
+
+        return self._get((path, (tuple(size), columns, count)), load)
+
+    def _get(self, key, loader):
+        # Held through the load, so a second caller waits for the first instead of decoding again
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+
+            self.misses += 1
+            try:
+                value = loader()
+            except (FileNotFoundError, OSError, ValueError):
+                # Remember failures too, so missing files aren't retried on every call
+                value = None
+
+            self._entries[key] = value
+            self.bytes += self._size_of(value)
+            return value
+
+    @staticmethod
+    def _size_of(value):
+        """Approximate decoded size in bytes (RGBA) of a texture or tuple of textures"""
+        if value is None:
+            return 0
+        textures = value if isinstance(value, tuple) else (value,)
+        return sum(tex.width * tex.height * 4 for tex in textures)
+
+    def stats(self):
+        """Return hit/miss/bytes counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes": self.bytes,
+            }
+
+    def clear(self):
+        """Drop every cached entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.bytes = 0
+
+
+# Shared instance used by enemies, towers and menus
+asset_cache = AssetCache()
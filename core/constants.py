@@ -6,4 +6,42 @@ SCREEN_TITLE = "Tower Defense"
 TILE_SCALING = 1.0
 TOWER_RANGE = 120
 TOWER_COLLISION_RADIUS = 24
-ROAD_BLOCK_RADIUS = 28
\ No newline at end of file
+ROAD_BLOCK_RADIUS = 28
+TOWER_IMAGE_PATH = "assets/free-archer-towers-pixel-art-for-tower-defense/1 Upgrade/first_build.png"
+TOWER_ICON_SCALE = 0.2
+
+# Keep enemy state in NumPy arrays (enemy_code/enemy_store.py)
+USE_ENEMY_STORE = False
+
+# Fixed simulation step (core/fixed_step.py)
+SIM_TICK_RATE = 60
+MAX_CATCH_UP_STEPS = 5
+RENDER_INTERPOLATION = True
+
+# Fast-forward (core/game_speed.py); dropping a speed level when the
+# simulation steps alone take longer than this per frame
+FAST_FORWARD_FRAME_BUDGET = 1 / 60 * 0.75
+
+# Pre-render the TMX tile layers into one texture (core/tile_bake.py)
+BAKE_TILE_LAYERS = True
+
+# Compiled map cache written next to each .tmx (core/map_cache.py)
+MAP_CACHE_ENABLED = True
+MAP_LOADER_QUIET = True
+
+# Record player commands so a session can be replayed (F9 saves to REPLAY_DIR)
+RECORD_INPUT = True
+REPLAY_DIR = "replays"
+
+# In-game profiler (core/frame_profiler.py): F3 toggles it, F4 dumps the frames to PROFILE_DIR
+PROFILER_HISTORY = 600
+PROFILE_DIR = "profiles"
+
+# Event log (core/event_log.py): records below a category's level cost
+# next to nothing; records at ECHO level and up are also printed, and
+# EVENT_LOG_FILE (if set) receives everything from a background thread
+EVENT_LOG_CAPACITY = 4096
+EVENT_LOG_LEVEL = "info"
+EVENT_LOG_ECHO_LEVEL = "info"
+EVENT_LOG_CATEGORIES = {"sim": "info", "map": "warning", "ui": "info"}
+EVENT_LOG_FILE = None
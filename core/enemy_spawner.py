@@ -1,4 +1,6 @@
 from enemy_code.enemy import Enemy  # or wherever your class is defined
 
-def spawn_enemy(spawn_point, path):
-    return Enemy(spawn_point, path)
+def spawn_enemy(spawn_point, path, store=None, **kwargs):
+    if store is not None:
+        return store.spawn(spawn_point, path, **kwargs)
+    return Enemy(spawn_point, path, **kwargs)
@@ -0,0 +1,152 @@
+import itertools
+import os
+import threading
+import time
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+_LEVELS_BY_NAME = {name.lower(): level for level, name in LEVEL_NAMES.items()}
+
+
+def parse_level(level):
+    """Accept a level number or a name like "debug" / "WARNING\""""
+    if isinstance(level, str):
+        return _LEVELS_BY_NAME[level.lower()]
+    return level
+
+
+class EventLog:
+    """Levelled, per-category event log kept in an in-memory ring buffer.
+
+    log() first compares the level against the category's threshold, so a
+    disabled call costs one dict lookup; messages are %-style templates that
+    are only formatted when a record is read, echoed or written out. The
+    newest capacity records are kept. Records at or above echo_level are
+    also printed straight away, and start_flush() appends new records to a
+    file from a background thread.
+    """
+
+    def __init__(self, capacity=4096, level=INFO, echo_level=INFO):
+        self.records = deque(maxlen=capacity)  # (seq, time, level, category, message, args)
+        self.default_level = parse_level(level)
+        self.echo_level = parse_level(echo_level)
+        self.thresholds = {}  # category -> minimum level
+        self.dropped = 0  # records that left the buffer before the flusher wrote them
+        self._seq = itertools.count()
+        self._flushed_seq = -1
+        self._flush_path = None
+        self._flush_lock = threading.Lock()
+        self._flush_thread = None
+        self._stop = threading.Event()
+
+    def set_level(self, category, level):
+        """Minimum level recorded for a category (None returns it to the default)"""
+        if level is None:
+            self.thresholds.pop(category, None)
+        else:
+            self.thresholds[category] = parse_level(level)
+
+    def configure(self, level=None, echo_level=None, categories=None, capacity=None):
+        if capacity is not None:
+            self.records = deque(self.records, maxlen=capacity)
+        if level is not None:
+            self.default_level = parse_level(level)
+        if echo_level is not None:
+            self.echo_level = parse_level(echo_level)
+        for category, category_level in (categories or {}).items():
+            self.set_level(category, category_level)
+
+    def enabled(self, category, level):
+        return level >= self.thresholds.get(category, self.default_level)
+
+    def log(self, category, level, message, *args):
+        if level >= self.thresholds.get(category, self.default_level):
+            self._record(category, level, message, args)
+
+    def _record(self, category, level, message, args):
+        record = (next(self._seq), time.time(), level, category, message, args)
+        self.records.append(record)
+        if level >= self.echo_level:
+            print(format_record(record, timestamp=False))
+
+    def debug(self, category, message, *args):
+        if DEBUG >= self.thresholds.get(category, self.default_level):
+            self._record(category, DEBUG, message, args)
+
+    def info(self, category, message, *args):
+        if INFO >= self.thresholds.get(category, self.default_level):
+            self._record(category, INFO, message, args)
+
+    def warning(self, category, message, *args):
+        if WARNING >= self.thresholds.get(category, self.default_level):
+            self._record(category, WARNING, message, args)
+
+    def error(self, category, message, *args):
+        if ERROR >= self.thresholds.get(category, self.default_level):
+            self._record(category, ERROR, message, args)
+
+    def recent(self, count=50, category=None, level=DEBUG):
+        """The newest records (optionally of one category / from a level up), formatted"""
+        records = [record for record in self.records.copy()
+                   if record[2] >= level and (category is None or record[3] == category)]
+        return [format_record(record) for record in records[-count:]]
+
+    def start_flush(self, path, interval=1.0):
+        """Append new records to path every interval seconds from a daemon thread"""
+        self.stop_flush()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._flush_path = path
+        self._stop.clear()
+        self._flush_thread = threading.Thread(target=self._flush_loop, args=(interval,),
+                                              name="event-log-flush", daemon=True)
+        self._flush_thread.start()
+
+    def stop_flush(self):
+        """Stop the flush thread after one last flush"""
+        if self._flush_thread is not None:
+            self._stop.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+
+    def flush(self):
+        """Write records added since the last flush to the flush file, if one is set"""
+        if self._flush_path is None:
+            return 0
+        with self._flush_lock:
+            # deque.copy() runs without releasing the GIL, so it is safe against appends
+            records = self.records.copy()
+            new = [record for record in records if record[0] > self._flushed_seq]
+            if not new:
+                return 0
+            if new[0][0] > self._flushed_seq + 1:
+                self.dropped += new[0][0] - self._flushed_seq - 1
+            with open(self._flush_path, "a", encoding="utf-8") as f:
+                f.writelines(format_record(record) + "\n" for record in new)
+            self._flushed_seq = new[-1][0]
+            return len(new)
+
+    def _flush_loop(self, interval):
+        while not self._stop.wait(interval):
+            self.flush()
+
+    def clear(self):
+        self.records.clear()
+
+
+def format_record(record, timestamp=True):
+    _, created, level, category, message, args = record
+    if args:
+        message = message % args
+    if not timestamp:
+        return f"[{category}] {message}" if level < WARNING else f"[{LEVEL_NAMES[level]}] [{category}] {message}"
+    stamp = time.strftime("%H:%M:%S", time.localtime(created)) + f".{int(created % 1 * 1000):03d}"
+    return f"{stamp} {LEVEL_NAMES[level]:<7} [{category}] {message}"
+
+
+# Shared log used by the game, the simulation and the loaders
+event_log = EventLog()
@@ -0,0 +1,37 @@
+ENEMY_KILLED = "enemy_killed"  # (enemy) health reached 0; its death animation starts
+ENEMY_LEAKED = "enemy_leaked"  # (enemy) walked off the end of the path
+ENEMY_REMOVED = "enemy_removed"  # (enemy) left play: death animation done, or leaked
+PROJECTILE_EXPIRED = "projectile_expired"  # (slot, target) target was killed or leaked before the hit
+
+# Event type -> the arguments its handlers are called with
+EVENT_TYPES = {
+    ENEMY_KILLED: ("enemy",),
+    ENEMY_LEAKED: ("enemy",),
+    ENEMY_REMOVED: ("enemy",),
+    PROJECTILE_EXPIRED: ("slot", "target"),
+}
+
+
+class EventBus:
+    """Synchronous publish/subscribe for game state changes.
+
+    Whatever changes the state emits the event right then, and every
+    subscribed handler runs before emit() returns, in subscription order.
+    Only the event types in EVENT_TYPES exist; subscribing to anything else
+    is an error, so a typo can't silently never fire.
+    """
+
+    def __init__(self):
+        self._handlers = {event_type: [] for event_type in EVENT_TYPES}
+
+    def subscribe(self, event_type, handler):
+        if event_type not in self._handlers:
+            raise KeyError(f"Unknown event type {event_type!r}")
+        self._handlers[event_type].append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        self._handlers[event_type].remove(handler)
+
+    def emit(self, event_type, *args):
+        for handler in self._handlers[event_type]:
+            handler(*args)
@@ -0,0 +1,40 @@
+class FixedStepClock:
+    """Turns variable frame times into a whole number of fixed-size simulation steps.
+
+    Frame time is added to an accumulator and drained in steps of exactly
+    step_size, so the simulation sees the same dt on every machine. At most
+    max_steps are run per frame; time beyond that is dropped (the game slows
+    down instead of spiralling). alpha is how far the leftover time reaches
+    into the next step and is used to interpolate rendering.
+    """
+
+    def __init__(self, tick_rate=60, max_steps=5):
+        self.step_size = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.dropped_time = 0.0
+
+    def advance(self, frame_time, speed=1):
+        """Add a frame's elapsed time and return how many steps to run.
+
+        speed scales game time against wall time (fast-forward); the step
+        size stays the same, so a faster speed just means more steps per frame.
+        """
+        self.accumulator += frame_time * speed
+        steps = int(self.accumulator / self.step_size)
+
+        max_steps = self.max_steps * speed
+        if steps > max_steps:
+            # Too far behind to catch up: run the cap and drop the rest
+            self.dropped_time += (steps - max_steps) * self.step_size
+            self.accumulator -= (steps - max_steps) * self.step_size
+            steps = max_steps
+
+        self.accumulator -= steps * self.step_size
+        self.alpha = self.accumulator / self.step_size
+        return steps
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 0.0
@@ -0,0 +1,196 @@
+import contextlib
+import csv
+import os
+import time
+from collections import deque
+
+import arcade
+from arcade.shape_list import create_rectangle_filled
+
+from core.overlay import OverlayLayer
+from core.event_log import event_log
+from core.text_layer import TextLayer
+
+_NO_SECTION = contextlib.nullcontext()
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class _Section:
+    """Context manager that adds its wall time to one section of the current frame"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+
+
+class FrameProfiler:
+    """Wall time of each game subsystem per frame, for the last history frames.
+
+    Wrap work in `with profiler.section("name"):` and call end_frame() once
+    per frame. Simulation phases are collected by passing sim_timings() to
+    Simulation.step; all steps run in one frame are summed per phase (under
+    "sim:<phase>"). While disabled nothing is timed or stored.
+    """
+
+    def __init__(self, history=600, budget=1 / 60):
+        self.frames = deque(maxlen=history)
+        self.budget = budget
+        self.enabled = False
+        self.names = []  # section names in the order they were first seen
+        self._current = {}
+        self._sim_timings = {}
+        self._frame_start = time.perf_counter()
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._current.clear()
+        self._sim_timings.clear()
+        self._frame_start = time.perf_counter()
+        return self.enabled
+
+    def section(self, name):
+        if not self.enabled:
+            return _NO_SECTION
+        return _Section(self, name)
+
+    def add(self, name, seconds):
+        if name not in self._current:
+            self._current[name] = 0.0
+            if name not in self.names:
+                self.names.append(name)
+        self._current[name] += seconds
+
+    def sim_timings(self):
+        """The timings dict to pass to Simulation.step, or None while disabled"""
+        return self._sim_timings if self.enabled else None
+
+    def end_frame(self):
+        """Close the current frame, recording its sections and total wall time"""
+        now = time.perf_counter()
+        if self.enabled:
+            for phase, samples in self._sim_timings.items():
+                self.add("sim:" + phase, sum(samples))
+            self._sim_timings.clear()
+            frame = self._current
+            frame["frame"] = now - self._frame_start
+            self.frames.append(frame)
+            self._current = {}
+        self._frame_start = now
+
+    def samples(self, name):
+        """Seconds spent in a section in each recorded frame (0 where it didn't run)"""
+        return [frame.get(name, 0.0) for frame in self.frames]
+
+    def stats(self, name):
+        """(mean, p99, max) of a section over the recorded frames, in seconds"""
+        samples = self.samples(name)
+        if not samples:
+            return 0.0, 0.0, 0.0
+        return sum(samples) / len(samples), percentile(samples, 99), max(samples)
+
+    def histogram(self, name, bins=16, limit=None):
+        """Counts of a section's frame times in bins from 0 to limit (default: the frame budget).
+
+        Frames slower than limit land in the last bin.
+        """
+        limit = limit or self.budget
+        counts = [0] * bins
+        for seconds in self.samples(name):
+            counts[min(bins - 1, int(seconds / limit * bins))] += 1
+        return counts
+
+    def over_budget(self):
+        """Number of recorded frames that took longer than the budget"""
+        return sum(1 for frame in self.frames if frame["frame"] > self.budget)
+
+    def dump_csv(self, path, last=None):
+        """Write the last frames (all recorded by default) to a CSV, one row per frame, in milliseconds"""
+        frames = list(self.frames)[-last:] if last else list(self.frames)
+        columns = ["frame"] + self.names
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["index"] + [column + "_ms" for column in columns])
+            for index, frame in enumerate(frames):
+                writer.writerow([index] + [f"{frame.get(column, 0.0) * 1000:.4f}" for column in columns])
+        event_log.info("perf", "Wrote %s profiled frames to %s", len(frames), path)
+        return path
+
+
+class ProfilerOverlay:
+    """Draws a FrameProfiler as a panel: mean and p99 per section plus a small histogram.
+
+    The figures and histogram bars are only recomputed every refresh_frames
+    frames and the text is retained, so the overlay itself stays cheap to draw.
+    """
+
+    ROW_HEIGHT = 18
+    WIDTH = 420
+    BINS = 16
+    HIST_WIDTH = 96
+
+    def __init__(self, profiler, refresh_frames=15):
+        self.profiler = profiler
+        self.refresh_frames = refresh_frames
+        self.text = TextLayer()
+        self.bars = OverlayLayer()
+        self.lines = []
+        self.frame_count = 0
+
+    def draw(self, left, top):
+        profiler = self.profiler
+        self.frame_count += 1
+        names = ["frame"] + profiler.names
+        bottom = top - self.ROW_HEIGHT * (len(names) + 1) - 6
+
+        # Histogram bars are scaled to the tallest bin of each row
+        hist_left = left + self.WIDTH - self.HIST_WIDTH - 8
+        key = (self.frame_count // self.refresh_frames, len(names), left, top)
+        if self.bars.update(key, lambda: self._build_bars(names, left, top, bottom, hist_left)):
+            # The figures refresh with the bars rather than every frame
+            over = profiler.over_budget()
+            self.lines = [f"{len(profiler.frames)} frames, {over} over {profiler.budget * 1000:.1f} ms  (F4: dump CSV)"]
+            for name in names:
+                mean, p99, _ = profiler.stats(name)
+                self.lines.append(f"{name:<16} avg {mean * 1000:6.2f}  p99 {p99 * 1000:6.2f} ms")
+        self.bars.draw()
+
+        for row, line in enumerate(self.lines):
+            self.text.draw_text(row, line, left + 6, top - self.ROW_HEIGHT * (row + 1) + 4, arcade.color.WHITE, 10,
+                                font_name=("Courier New", "Courier", "monospace"))
+        self.text.draw()
+
+    def _build_bars(self, names, left, top, bottom, hist_left):
+        profiler = self.profiler
+        shapes = [create_rectangle_filled((left + left + self.WIDTH) / 2, (top + bottom) / 2,
+                                          self.WIDTH, top - bottom, (0, 0, 0, 180))]
+        bar_width = self.HIST_WIDTH / self.BINS
+        for row, name in enumerate(names, start=1):
+            counts = profiler.histogram(name, self.BINS)
+            peak = max(counts) or 1
+            row_bottom = top - self.ROW_HEIGHT * (row + 1) + 2
+            for n, count in enumerate(counts):
+                if not count:
+                    continue
+                height = max(1.0, (self.ROW_HEIGHT - 4) * count / peak)
+                # The last bin also collects everything over the budget
+                color = arcade.color.RED if n == self.BINS - 1 else arcade.color.LIGHT_GREEN
+                shapes.append(create_rectangle_filled(hist_left + (n + 0.5) * bar_width, row_bottom + height / 2,
+                                                      bar_width - 1, height, color))
+        return shapes
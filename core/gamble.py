@@ -0,0 +1,52 @@
+from core.event_log import event_log
+from tower_code.upgrade_rules import apply_effects
+
+# The gamble wheel in wheel order: outcome -> (weight, effects on the tower's
+# stats; see tower_code/upgrade_rules.py). FREE changes nothing and refunds
+# the spin. The simulation rolls the outcome with its seeded RNG;
+# GambleMiniGame sizes its segments from the same weights and only animates
+# the wheel to the result.
+GAMBLE_WHEEL = {
+    "DOUBLE": (0.2, (("damage", 2, 0, None), ("range", 2, 0, None), ("attack_speed", 2, 0, None))),
+    "HALF": (0.3, (("damage", 0.5, 0, None), ("range", 0.5, 0, None), ("attack_speed", 0.5, 0, None))),
+    "NOTHING": (0.3, ()),
+    "FREE": (0.15, ()),
+    "MAX": (0.05, (("damage", 1, 5, None), ("range", 1, 100, None), ("attack_speed", 1, 2.5, None))),
+}
+GAMBLE_OUTCOMES = tuple(GAMBLE_WHEEL)
+GAMBLE_WEIGHTS = tuple(weight for weight, _ in GAMBLE_WHEEL.values())
+REFUND_OUTCOME = "FREE"
+
+GAMBLE_MESSAGES = {
+    "DOUBLE": "🎉 DOUBLE! All stats doubled!",
+    "HALF": "💔 HALF! All stats halved!",
+    "NOTHING": "😐 NOTHING! No changes made.",
+    "MAX": "🔥 MAX! +5 damage, +100 range, +2.5 attack speed!",
+}
+
+
+def roll_gamble(rng):
+    """Pick a gamble outcome by its weight"""
+    return rng.choices(GAMBLE_OUTCOMES, weights=GAMBLE_WEIGHTS)[0]
+
+
+def wheel_segments():
+    """(outcome, start angle, sweep) in degrees for each segment, sized by its chance"""
+    total = sum(GAMBLE_WEIGHTS)
+    segments = []
+    start = 0.0
+    for outcome, weight in zip(GAMBLE_OUTCOMES, GAMBLE_WEIGHTS):
+        sweep = 360.0 * weight / total
+        segments.append((outcome, start, sweep))
+        start += sweep
+    return segments
+
+
+def apply_gamble(tower, result, refund):
+    """Apply a gamble outcome to a tower. Returns the money to give back to the player."""
+    apply_effects(tower.properties, GAMBLE_WHEEL[result][1])
+    if result == REFUND_OUTCOME:
+        event_log.info("sim", "🎁 FREE! $%s refunded!", refund)
+        return refund
+    event_log.info("sim", GAMBLE_MESSAGES[result])
+    return 0
@@ -0,0 +1,60 @@
+from core.event_log import event_log
+
+SPEED_SETTINGS = (1, 2, 4, 8, 16)
+
+
+class SpeedControl:
+    """Fast-forward multiplier chosen by the player, throttled by a frame budget.
+
+    selected is what the player asked for; multiplier is what actually runs.
+    When the simulation steps for a frame take longer than frame_budget
+    several frames in a row, multiplier drops to the next lower setting.
+    Once there is plenty of headroom again it climbs back towards selected.
+    """
+
+    def __init__(self, settings=SPEED_SETTINGS, frame_budget=1 / 60 * 0.75,
+                 slow_frames=3, recover_frames=120):
+        self.settings = tuple(sorted(settings))
+        self.frame_budget = frame_budget
+        self.slow_frames = slow_frames
+        self.recover_frames = recover_frames
+        self.selected = self.settings[0]
+        self.multiplier = self.selected
+        self._over_budget = 0
+        self._under_budget = 0
+
+    def select(self, speed):
+        """Switch to a speed setting (snapped to the nearest one not above it)"""
+        allowed = [s for s in self.settings if s <= speed] or [self.settings[0]]
+        self.selected = self.multiplier = allowed[-1]
+        self._over_budget = self._under_budget = 0
+        return self.selected
+
+    def cycle(self):
+        """Move to the next speed setting, wrapping back to 1x after the fastest"""
+        index = self.settings.index(self.selected)
+        return self.select(self.settings[(index + 1) % len(self.settings)])
+
+    def report(self, step_time):
+        """Record how long this frame's simulation steps took and adjust the multiplier"""
+        if step_time > self.frame_budget:
+            self._under_budget = 0
+            self._over_budget += 1
+            if self._over_budget >= self.slow_frames and self.multiplier > self.settings[0]:
+                self.multiplier = self.settings[self.settings.index(self.multiplier) - 1]
+                self._over_budget = 0
+                event_log.warning("perf", "Fast-forward throttled to %sx", self.multiplier)
+        else:
+            self._over_budget = 0
+            # Only climb back if the next setting up would still fit the budget
+            if self.multiplier < self.selected and step_time * 2 < self.frame_budget:
+                self._under_budget += 1
+                if self._under_budget >= self.recover_frames:
+                    self.multiplier = self.settings[self.settings.index(self.multiplier) + 1]
+                    self._under_budget = 0
+            else:
+                self._under_budget = 0
+
+    @property
+    def throttled(self):
+        return self.multiplier < self.selected
@@ -1,26 +1,39 @@
+import os
+import time
 import arcade
 from core.constants import *  
 from core.map_loader import load_map_and_path
-from enemy_code.enemy import Enemy
-from core.enemy_spawner import spawn_enemy
+from core.simulation import Simulation
+from core.fixed_step import FixedStepClock
+from core.game_speed import SpeedControl
 from tower_code.TowerMenu import TowerMenuClass   
-from tower_code.Tower import Tower
+from tower_code.tower_stats import base_stats, tower_stat
 from core.PlayStopBTN import PlayPauseButton
+from core.FastForwardBTN import FastForwardButton
+from core.hp_bars import HealthBars
+from core.text_layer import TextLayer
+from core.overlay import OverlayLayer, range_circle
+from core.tile_bake import BakedTileLayers
+from arcade.shape_list import create_ellipse_filled, create_rectangle_filled
 from core.UpgradeMenu import UpgradeMenu
 from core.UpgradePathMenu import UpgradePathMenu
 from core.GambleMiniGame import GambleMiniGame
 from core.LevelData import LevelData
 from core.LevelManager import LevelManager
-import math
+from core.replay import InputRecorder
+from core.event_log import event_log
+from core.frame_profiler import FrameProfiler, ProfilerOverlay
 
 class TowerDefenseGame(arcade.View):
-    def __init__(self, level_data):
+    def __init__(self, level_data, use_enemy_store=USE_ENEMY_STORE, preloaded=None):
         super().__init__()
+        self.level_data = level_data
+        self.preloaded = preloaded  # load_map_and_path result from LevelPreloader, used by the first setup()
+        self.use_enemy_store = use_enemy_store
+        self.clock = FixedStepClock(SIM_TICK_RATE, MAX_CATCH_UP_STEPS)
+        self.speed = SpeedControl(frame_budget=FAST_FORWARD_FRAME_BUDGET)
         self.map_path = level_data.map_path
         self.gamble_minigame = GambleMiniGame(SCREEN_WIDTH, SCREEN_HEIGHT, UI_BAR_HEIGHT)
-        self.money = level_data.money_start
-        self.lives = level_data.lives
-        self.waves = level_data.waves
         self.hovered_tower_type = None 
         self.mouse_x = 0  # Track mouse position
         self.mouse_y = 0
@@ -38,7 +51,20 @@ class TowerDefenseGame(arcade.View):
         80,  # width
         40   # height
         )
+        self.fast_forward_button = FastForwardButton(SCREEN_WIDTH - 190, UI_BAR_HEIGHT - 50, self.speed)
         self.upgrade_path_menu = UpgradePathMenu(SCREEN_WIDTH, SCREEN_HEIGHT, UI_BAR_HEIGHT)
+        self.hud_text = TextLayer()
+        # F3 shows per-subsystem frame times, F4 dumps them to CSV
+        self.profiler = FrameProfiler(PROFILER_HISTORY, budget=1 / 60)
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+
+        # Baked overlay geometry: UI bar, path markers, selected tower ranges,
+        # and the cursor ranges (built around the origin and moved with the mouse)
+        self.static_overlay = OverlayLayer()
+        self.path_overlay = OverlayLayer()
+        self.selection_overlay = OverlayLayer()
+        self.ghost_range_overlay = OverlayLayer()
+        self.hover_range_overlay = OverlayLayer()
         
         # Setup will be called after initialization
         self.setup()
@@ -49,22 +75,41 @@ class TowerDefenseGame(arcade.View):
     def setup(self):
         """Set up the game"""
         # --- Load map and scene, extract spawn and path ---
-        self.tile_map, self.scene, self.spawn_point, self.enemy_path = load_map_and_path(self.map_path, TILE_SCALING)
-
-        # --- Set up enemy list ---
-        self.scene.add_sprite_list("Enemies", use_spatial_hash=True)
-        self.enemy_spawn_timer = 0.0
-        self.enemies_spawned = 0
-        self.current_wave = 0
-        self.current_wave_spawned = 0
-        self.total_enemies_to_spawn = self.waves[self.current_wave]["count"]
-        self.enemy_spawn_rate = self.waves[self.current_wave]["spawn_rate"]
-        self.enemy_type = self.waves[self.current_wave]["enemy"]
+        loaded, self.preloaded = self.preloaded, None
+        if loaded is None:
+            loaded = load_map_and_path(self.map_path, TILE_SCALING, quiet=MAP_LOADER_QUIET, use_cache=MAP_CACHE_ENABLED)
+        self.tile_map, self.scene, self.spawn_point, self.enemy_path, self.path_table = loaded
+
+        # --- Game rules run in the simulation; the view only renders its sprite lists ---
+        self.sim = Simulation(self.level_data, self.spawn_point, self.path_table,
+                              use_enemy_store=self.use_enemy_store)
+        # Every player command goes through sim.execute and is recorded for replay
+        self.recorder = None
+        if RECORD_INPUT:
+            self.recorder = InputRecorder(self.level_data, self.sim.seed, SIM_TICK_RATE, self.use_enemy_store)
+            self.sim.recorder = self.recorder
+        # The terrain never changes: swap the tile layers for one baked texture drawn under the scene
+        self.baked_tiles = None
+        if BAKE_TILE_LAYERS:
+            self.baked_tiles = BakedTileLayers(self.tile_map.sprite_lists.values())
+            for layer_name in self.tile_map.sprite_lists:
+                self.scene.remove_sprite_list_by_name(layer_name)
+
+        self.scene.add_sprite_list("Enemies", sprite_list=self.sim.enemies)
+        self.scene.add_sprite_list("Towers", sprite_list=self.sim.towers)
+        self.hp_bars = HealthBars()
 
         # Setup towers
         self.tower_menu = TowerMenuClass(UI_BAR_HEIGHT)
-        self.scene.add_sprite_list("Towers")
-        self.tower_menu.add_icon("assets/free-archer-towers-pixel-art-for-tower-defense/1 Upgrade/first_build.png", 60, "basic")
+        self.tower_menu.add_icon(TOWER_IMAGE_PATH, 60, "basic")
+
+    @property
+    def money(self):
+        return self.sim.money
+
+    @money.setter
+    def money(self, value):
+        self.sim.money = value
 
     def on_mouse_motion(self, x: int, y: int, dx: int, dy: int):
         """Update mouse position and handle hover effects"""
@@ -85,149 +130,196 @@ class TowerDefenseGame(arcade.View):
             self.hovered_tower_type = hovered_icon.properties["type"]
 
     def on_draw(self):
+        section = self.profiler.section
+        with section("sync_sprites"):
+            self.sim.sync_sprites(self.clock.alpha if RENDER_INTERPOLATION else None)
         self.clear()
-        self.scene.draw()
-        self.upgrade_path_menu.draw(self.money)
+        with section("scene.draw"):
+            if self.baked_tiles:
+                # Bakes on the first frame and again whenever the window is resized
+                self.baked_tiles.ensure(self.window.width, self.window.height)
+                self.baked_tiles.draw()
+            self.scene.draw()
+        with section("menus"):
+            self.upgrade_path_menu.draw(self.money)
         
         
-        # Draw enemies (they handle their own drawing including death animations)
-        for enemy in self.scene["Enemies"]:
-            enemy.draw()
+        # Enemy sprites are drawn with the scene; all HP bars go in one batch
+        with section("hp_bars"):
+            self.hp_bars.sync(self.sim.enemies)
+            self.hp_bars.draw()
         
         # Draw towers
-        self.scene["Towers"].draw()
+        with section("towers"):
+            self.scene["Towers"].draw()
         
-        # Draw tower ranges for selected towers
-        for tower in self.scene["Towers"]:
-            if hasattr(tower, 'show_range') and tower.show_range:
-                arcade.draw_circle_outline(
-                    tower.center_x,
-                    tower.center_y,
-                    tower.properties.get("range", TOWER_RANGE),
-                    arcade.color.YELLOW,
-                    border_width=3
-                )
+        # Draw tower ranges for selected towers (rebuilt only when the selection changes)
+        with section("overlays"):
+            selected = tuple(
+                (tower.center_x, tower.center_y, tower.properties.get("range", TOWER_RANGE))
+                for tower in self.scene["Towers"] if getattr(tower, 'show_range', False)
+            )
+            self.selection_overlay.update(selected, lambda: [
+                range_circle(x, y, radius, arcade.color.YELLOW, 3) for x, y, radius in selected
+            ])
+            self.selection_overlay.draw()
         
-        # Draw tower projectiles and attack effects
-        for tower in self.scene["Towers"]:
-            tower.projectiles.draw()
-            tower.draw_attack_effect()
+        # Draw all projectiles in one call, then tower attack effects
+        with section("projectiles"):
+            self.sim.projectiles.draw()
+            for tower in self.scene["Towers"]:
+                tower.draw_attack_effect()
         
         # Draw ghost tower if it exists
-        if self.ghost_tower:
-            arcade.draw_sprite(self.ghost_tower)
+        with section("overlays"):
+            if self.ghost_tower:
+                arcade.draw_sprite(self.ghost_tower)
+                
+                # Draw range for ghost tower
+                if hasattr(self.ghost_tower, 'properties'):
+                    ghost_range = self.ghost_tower.properties.get("range", TOWER_RANGE)
+                    self.ghost_range_overlay.update(ghost_range, lambda: [
+                        range_circle(0, 0, ghost_range, arcade.color.LIGHT_GRAY, 2)
+                    ])
+                    self.ghost_range_overlay.position = self.ghost_tower.position
+                    self.ghost_range_overlay.draw()
             
-            # Draw range for ghost tower
-            if hasattr(self.ghost_tower, 'properties'):
-                arcade.draw_circle_outline(
-                    self.ghost_tower.center_x,
-                    self.ghost_tower.center_y,
-                    self.ghost_tower.properties.get("range", TOWER_RANGE),
-                    arcade.color.LIGHT_GRAY,
-                    border_width=2
+            # Draw range preview when hovering over menu icons
+            if self.hovered_tower_type and self.mouse_y > UI_BAR_HEIGHT:
+                # Read the range straight from the stat registry, no tower needed
+                hover_range = tower_stat(self.hovered_tower_type, "range", TOWER_RANGE)
+                self.hover_range_overlay.update(hover_range, lambda: [
+                    range_circle(0, 0, hover_range, arcade.color.LIGHT_GRAY, 1)
+                ])
+                self.hover_range_overlay.position = (self.mouse_x, self.mouse_y)
+                self.hover_range_overlay.draw()
+                
+                # Draw range text
+                self.hud_text.draw_text(
+                    "hover_range",
+                    f"Range: {hover_range}",
+                    self.mouse_x + 20,
+                    self.mouse_y - 20,
+                    arcade.color.WHITE,
+                    12
                 )
-        
-        # Draw range preview when hovering over menu icons
-        if self.hovered_tower_type and self.mouse_y > UI_BAR_HEIGHT:
-            # Create a temporary tower to get properties
-            temp_tower = Tower(self.hovered_tower_type, "", 1.0)
-            arcade.draw_circle_outline(
-                self.mouse_x,
-                self.mouse_y,
-                temp_tower.properties.get("range", TOWER_RANGE),
-                arcade.color.LIGHT_GRAY,
-                border_width=1
-            )
             
-            # Draw range text
-            arcade.draw_text(
-                f"Range: {temp_tower.properties.get('range', TOWER_RANGE)}",
-                self.mouse_x + 20,
-                self.mouse_y - 20,
-                arcade.color.WHITE,
-                12
-            )
-        
-        
-        
-        # Draw UI bar (AFTER menus so menus appear on top)
-        arcade.draw_lbwh_rectangle_filled(
-            0,                # left
-            0,                # bottom
-            SCREEN_WIDTH,     # width
-            UI_BAR_HEIGHT,    # height
-            arcade.color.DARK_SLATE_GRAY
-        )
-        
-        # Draw money counter
-        arcade.draw_text(f"Money: ${self.money}", 20, UI_BAR_HEIGHT - 30, arcade.color.WHITE, 20)
+            
+            
+            # Draw UI bar (AFTER menus so menus appear on top)
+            self.static_overlay.update(None, self.build_static_overlay)
+            self.static_overlay.draw()
         
-        self.tower_menu.draw()
+        with section("hud_text"):
+            # Draw money counter
+            self.hud_text.draw_text("money", f"Money: ${self.money}", 20, UI_BAR_HEIGHT - 30, arcade.color.WHITE, 20)
+            self.hud_text.draw_text("lives", f"Lives: {self.sim.lives}", 250, UI_BAR_HEIGHT - 30, arcade.color.WHITE, 20)
+            
+            self.tower_menu.draw()
 
-        # Optional: draw the path
-        for x, y in self.enemy_path:
-            arcade.draw_circle_filled(x, y, 5, arcade.color.RED)
+            # Optional: draw the path (over the tower menu, as it always was)
+            self.path_overlay.update(self.enemy_path, self.build_path_overlay)
+            self.path_overlay.draw()
 
-        # Draw play/pause button
-        self.play_pause_button.draw()
-        
-        # Debug text to see menu status (optional - can remove later)
-        if self.upgrade_path_menu.visible:
-            arcade.draw_text(
-                f"Path Menu: X={self.upgrade_path_menu.current_x}",
-                10, SCREEN_HEIGHT - 60, arcade.color.BLUE, 16
-            )
+            # Draw play/pause button
+            self.play_pause_button.draw()
+            self.fast_forward_button.draw()
+            
+            # Debug text to see menu status (optional - can remove later)
+            if self.upgrade_path_menu.visible:
+                self.hud_text.draw_text(
+                    "path_menu_debug",
+                    f"Path Menu: X={self.upgrade_path_menu.current_x}",
+                    10, SCREEN_HEIGHT - 60, arcade.color.BLUE, 16
+                )
+
+            self.hud_text.draw()
+
+        with section("menus"):
+            self.gamble_minigame.draw()
+
+        # The overlay's own drawing is left out of the figures it shows
+        if self.profiler.enabled:
+            self.profiler_overlay.draw(SCREEN_WIDTH - ProfilerOverlay.WIDTH - 10, SCREEN_HEIGHT - 10)
+        self.profiler.end_frame()
+
+    def build_static_overlay(self):
+        """Shapes that never change: the UI bar"""
+        return [create_rectangle_filled(SCREEN_WIDTH / 2, UI_BAR_HEIGHT / 2, SCREEN_WIDTH, UI_BAR_HEIGHT,
+                                        arcade.color.DARK_SLATE_GRAY)]
 
-        self.gamble_minigame.draw()
+    def build_path_overlay(self):
+        """Markers on the enemy path; only change with the level"""
+        return [create_ellipse_filled(x, y, 10, 10, arcade.color.RED, num_segments=16) for x, y in self.enemy_path]
 
     def on_mouse_press(self, x, y, button, modifiers):
         if hasattr(self, 'gamble_minigame') and self.gamble_minigame.visible:
-            print("Minigame is visible, checking click...")
+            event_log.debug("ui", "Minigame is visible, checking click...")
             if self.gamble_minigame.animation_phase == 2:  # Result shown
                 self.gamble_minigame.hide()
-                print("Hiding minigame after result")
+                event_log.debug("ui", "Hiding minigame after result")
                 return
             elif self.gamble_minigame.check_click(x, y):
-                print("Minigame button clicked")
+                event_log.debug("ui", "Minigame button clicked")
+                # The simulation charges and rolls; the wheel only animates to the result
+                tower = self.gamble_minigame.tower
+                result = self.sim.execute("gamble", self.sim.towers.index(tower))
+                if result is None:
+                    event_log.info("ui", "Not enough money for gamble! Need $%s", tower.get_upgrade_cost())
+                    self.gamble_minigame.hide()
+                elif result is False:
+                    event_log.info("ui", "Tower is already at max level!")
+                    self.gamble_minigame.hide()
+                else:
+                    self.gamble_minigame.spin(result)
                 return
             else:
-                print("Click was not on minigame button")
-         # First, check if the user clicked the upgrade path menu
+                event_log.debug("ui", "Click was not on minigame button")
+
+        if self.fast_forward_button.check_click(x, y):
+            event_log.info("ui", "Game speed %sx", self.fast_forward_button.click())
+            return
+        # Targeting mode buttons at the top of the upgrade path menu
+        targeting_mode = self.upgrade_path_menu.check_targeting_click(x, y)
+        if targeting_mode:
+            tower = self.upgrade_path_menu.selected_tower
+            self.sim.execute("targeting", self.sim.towers.index(tower), targeting_mode)
+            event_log.info("ui", "%s tower now targets %s", tower.tower_type.capitalize(), targeting_mode)
+            return
+
+        # Then check if the user clicked an upgrade path button
         if self.upgrade_path_menu.visible and self.upgrade_path_menu.current_x > -300:
             selected_path = self.upgrade_path_menu.check_click(x, y)
             if selected_path:
-                print(f"DEBUG: Selected path = {selected_path}")  # ADD THIS DEBUG PRINT
+                event_log.debug("ui", "Selected path = %s", selected_path)
                 
                 # CHECK FOR GAMBLE MINIGAME SPECIFICALLY
                 if selected_path == "gamble_minigame":
-                    print("🎰 GAMBLE MINIGAME TRIGGERED!")
+                    event_log.debug("ui", "Gamble minigame triggered")
                     tower = self.upgrade_path_menu.selected_tower
                     upgrade_cost = tower.get_upgrade_cost()
                     
                     if self.money >= upgrade_cost:
-                        self.money -= upgrade_cost
                         self.upgrade_path_menu.hide()
-                        self.gamble_minigame.show(tower, [self.money])
-                        print("Minigame opened successfully!")
+                        self.gamble_minigame.show(tower)
+                        event_log.debug("ui", "Minigame opened")
                     else:
-                        print(f"Not enough money for gamble! Need ${upgrade_cost}")
+                        event_log.info("ui", "Not enough money for gamble! Need $%s", upgrade_cost)
                     return
                 else:
                     # Handle regular upgrades (damage, range, speed)
                     tower = self.upgrade_path_menu.selected_tower
                     upgrade_cost = tower.get_upgrade_cost()
                     
-                    if self.money >= upgrade_cost:
-                        self.money -= upgrade_cost
-                        success = tower.upgrade(selected_path)
-                        if success:
-                            print(f"Upgraded via {selected_path} path")
-                            self.upgrade_path_menu.show(tower)
-                        else:
-                            print("Upgrade failed")
-                            self.upgrade_path_menu.hide()
+                    success = self.sim.execute("upgrade", self.sim.towers.index(tower), selected_path)
+                    if success is None:
+                        event_log.info("ui", "Not enough money! Need $%s, have $%s", upgrade_cost, self.money)
+                    elif success:
+                        event_log.info("ui", "Upgraded via %s path", selected_path)
+                        self.upgrade_path_menu.show(tower)
                     else:
-                        print(f"Not enough money! Need ${upgrade_cost}, have ${self.money}")
+                        event_log.info("ui", "Upgrade failed")
+                        self.upgrade_path_menu.hide()
                     return
         
         # Check if clicking on tower menu icons (this should come BEFORE upgrade menu check)
@@ -241,9 +333,9 @@ class TowerDefenseGame(arcade.View):
                 self.upgrade_path_menu.hide()
             
             # Check if player can afford this tower
-            tower_cost = clicked_icon.properties.get("cost", 100)
+            tower_cost = tower_stat(clicked_icon.properties["type"], "cost", 100)
             if self.money < tower_cost:
-                print(f"Not enough money! Need ${tower_cost}, have ${self.money}")
+                event_log.info("ui", "Not enough money! Need $%s, have $%s", tower_cost, self.money)
                 return
                 
             # Store the selected tower properties
@@ -261,14 +353,9 @@ class TowerDefenseGame(arcade.View):
             self.ghost_tower.center_y = y
             
             # Add properties to ghost tower for range drawing
-            temp_tower = Tower(
-                self.selected_tower_type, 
-                self.selected_tower_image, 
-                self.selected_tower_scale
-            )
-            self.ghost_tower.properties = temp_tower.properties
+            self.ghost_tower.properties = base_stats(self.selected_tower_type)
             
-            print(f"Selected tower: {self.selected_tower_type} at ({x}, {y})")
+            event_log.debug("ui", "Selected tower: %s at (%s, %s)", self.selected_tower_type, x, y)
             self.active_tower = None  
             
             # Hide range for all towers when selecting a new tower
@@ -298,7 +385,7 @@ class TowerDefenseGame(arcade.View):
             # Show upgrade path menu for this tower
             self.upgrade_path_menu.show(self.active_tower)  # REMOVE THE if/else CONDITION
             
-            print(f"Selected tower: {self.active_tower.tower_type} (Level {self.active_tower.level})")
+            event_log.debug("ui", "Selected tower: %s (Level %s)", self.active_tower.tower_type, self.active_tower.level)
             
             # Clear any tower placement selection
             self.selected_tower_type = None
@@ -312,23 +399,15 @@ class TowerDefenseGame(arcade.View):
             if self.upgrade_path_menu.visible:
                 self.upgrade_path_menu.hide()
             
-            # Create the actual tower using the Tower class
-            new_tower = Tower(
-                tower_type=self.selected_tower_type,
-                image_path=self.selected_tower_image,
-                scale=self.selected_tower_scale
+            # Create the actual tower (the simulation deducts the cost)
+            new_tower = self.sim.execute(
+                "place_tower", self.selected_tower_type, x, y,
+                self.selected_tower_image, self.selected_tower_scale
             )
-            new_tower.center_x = x
-            new_tower.center_y = y
-            
-            # Deduct money for tower placement
-            tower_cost = new_tower.get_cost()
-            if self.money >= tower_cost:
-                self.money -= tower_cost
-                self.scene["Towers"].append(new_tower)
-                print(f"Placed {self.selected_tower_type} tower at ({x}, {y}) for ${tower_cost}")
+            if new_tower:
+                event_log.info("ui", "Placed %s tower at (%s, %s) for $%s", self.selected_tower_type, x, y, new_tower.get_cost())
             else:
-                print(f"Not enough money to place tower! Need ${tower_cost}, have ${self.money}")
+                event_log.info("ui", "Not enough money to place tower! Have $%s", self.money)
             
             # Clear selection and ghost tower
             self.selected_tower_type = None
@@ -369,7 +448,7 @@ class TowerDefenseGame(arcade.View):
                 self.selected_tower_type = None
                 if hasattr(self.tower_menu, 'selected_tower_type'):
                     self.tower_menu.selected_tower_type = None
-                print("Tower placement cancelled")
+                event_log.debug("ui", "Tower placement cancelled")
             else:
                 # Return to level select
                 from level_select import LevelSelectView
@@ -380,93 +459,45 @@ class TowerDefenseGame(arcade.View):
         if key == arcade.key.SPACE:
             # Toggle play/pause with spacebar
             self.play_pause_button.toggle()
-            print("Game", "paused" if self.play_pause_button.is_paused else "resumed")
+            self.sim.execute("pause", self.play_pause_button.is_paused)
+            event_log.info("ui", "Game %s", "paused" if self.play_pause_button.is_paused else "resumed")
             return
-    
 
-    def update_towers(self, delta_time):
-        """Update all towers and handle their attacks"""
-        for tower in self.scene["Towers"]:
-            # Update the tower (cooldowns, etc.)
-            tower.update(delta_time)
-            
-            # Get only living enemies (not dying ones) for targeting
-            living_enemies = [e for e in self.scene["Enemies"] if hasattr(e, 'alive') and e.alive and not (hasattr(e, 'is_dying') and e.is_dying)]
-            
-            if living_enemies:
-                # Make the tower attack if possible
-                tower.attack(delta_time, living_enemies)
-            
-            # Update projectiles and check for hits
-            for projectile in tower.projectiles:
-                # Move projectile towards target
-                if (projectile.properties["target"] and 
-                    hasattr(projectile.properties["target"], 'alive') and
-                    projectile.properties["target"].alive and
-                    not (hasattr(projectile.properties["target"], 'is_dying') and projectile.properties["target"].is_dying)):
-                    
-                    target = projectile.properties["target"]
-                    dx = target.center_x - projectile.center_x
-                    dy = target.center_y - projectile.center_y
-                    distance = math.sqrt(dx * dx + dy * dy)
-                    
-                    if distance > 0:
-                        # Move projectile
-                        speed = projectile.properties["speed"] * delta_time
-                        projectile.center_x += (dx / distance) * speed
-                        projectile.center_y += (dy / distance) * speed
-                        
-                        # Check if projectile hit target
-                        if distance < 10:  # Hit threshold
-                            target.take_damage(projectile.properties["damage"])
-                            projectile.remove_from_sprite_lists()
-                else:
-                    # Target is dead or gone, remove projectile
-                    projectile.remove_from_sprite_lists()
+        if key == arcade.key.F9 and self.recorder:
+            # Save everything played so far; replay it with python -m core.replay <file>
+            path = os.path.join(REPLAY_DIR, time.strftime("replay_%Y%m%d_%H%M%S.json"))
+            self.recorder.save(path, self.sim)
+            return
+
+        if key == arcade.key.F3:
+            event_log.info("ui", "Profiler %s", "on" if self.profiler.toggle() else "off")
+            return
+
+        if key == arcade.key.F4 and self.profiler.frames:
+            path = os.path.join(PROFILE_DIR, time.strftime("frames_%Y%m%d_%H%M%S.csv"))
+            self.profiler.dump_csv(path)
+            return
+
+        if key == arcade.key.F:
+            # Cycle fast-forward speed
+            event_log.info("ui", "Game speed %sx", self.speed.cycle())
+            return
+    
 
     def on_update(self, delta_time):
-        self.gamble_minigame.update(delta_time)
+        with self.profiler.section("menus"):
+            self.gamble_minigame.update(delta_time)
 
         if self.play_pause_button and self.play_pause_button.is_paused:
             return
-        self.scene.update(delta_time)
-
-        self.enemy_spawn_timer += delta_time
-
-        # Spawn new enemies
-        if self.enemy_spawn_timer > self.enemy_spawn_rate and self.current_wave_spawned < self.total_enemies_to_spawn:
-            enemy = spawn_enemy(self.spawn_point, self.enemy_path)
-            self.scene["Enemies"].append(enemy)
-            self.current_wave_spawned += 1
-            self.enemy_spawn_timer = 0.0
-
-        # Update enemies individually to handle death animations
-        for enemy in self.scene["Enemies"]:
-            enemy.update(delta_time)
-        if self.current_wave_spawned >= self.total_enemies_to_spawn and not self.scene["Enemies"]:
-            self.current_wave += 1
-        if self.current_wave < len(self.waves):
-            self.current_wave_spawned = 0
-            self.total_enemies_to_spawn = self.waves[self.current_wave]["count"]
-            self.enemy_spawn_rate = self.waves[self.current_wave]["spawn_rate"]
-            self.enemy_type = self.waves[self.current_wave]["enemy"]
-        else:
-            print("Level complete!")
-
-        # Remove dead enemies that finished their animation
-        enemies_to_remove = []
-        for enemy in self.scene["Enemies"]:
-            if hasattr(enemy, 'should_remove') and enemy.should_remove():
-                enemies_to_remove.append(enemy)
-                # Give reward when enemy is completely removed
-                self.money += enemy.reward
-                print(f"Enemy killed! +{enemy.reward} gold")
-        
-        for enemy in enemies_to_remove:
-            self.scene["Enemies"].remove(enemy)
-        
-        self.upgrade_path_menu.update()
-    
-        # Update towers and their attacks
-        self.update_towers(delta_time)
+        if self.sim.lives <= 0:
+            return
+        # Fast-forward runs more fixed steps per frame; only the steps are timed
+        # against the frame budget, rendering still happens once
+        start = time.perf_counter()
+        for _ in range(self.clock.advance(delta_time, self.speed.multiplier)):
+            self.sim.step(self.clock.step_size, self.profiler.sim_timings())
+        self.speed.report(time.perf_counter() - start)
 
+        with self.profiler.section("menus"):
+            self.upgrade_path_menu.update()
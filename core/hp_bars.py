@@ -0,0 +1,83 @@
+import arcade
+
+HP_BAR_BACKGROUND = arcade.color.GRAY
+HP_BAR_HEALTHY = arcade.color.GREEN
+HP_BAR_LOW = arcade.color.RED
+HP_BAR_LOW_FRACTION = 0.3
+
+
+class HealthBars:
+    """Health bars for every enemy, drawn together as one SpriteList.
+
+    Each enemy owns a background and a foreground solid-colour sprite,
+    created the first time it is seen and reused for as long as it stays
+    in the enemy list (pooled enemies keep theirs across respawns). A bar's
+    sprites are only touched when its enemy has moved, changed health or
+    stopped being drawable, so a frame where nothing changed costs one
+    comparison per enemy and a single draw call.
+    """
+
+    def __init__(self):
+        self.sprites = arcade.SpriteList()
+        self._bars = {}  # enemy -> [background, foreground, last drawn state]
+
+    def _create(self, enemy):
+        background = arcade.SpriteSolidColor(enemy.hp_bar_width, enemy.hp_bar_height, color=HP_BAR_BACKGROUND)
+        foreground = arcade.SpriteSolidColor(enemy.hp_bar_width, enemy.hp_bar_height, color=HP_BAR_HEALTHY)
+        self.sprites.append(background)
+        self.sprites.append(foreground)
+        bar = [background, foreground, None]
+        self._bars[enemy] = bar
+        return bar
+
+    def sync(self, enemies):
+        """Bring every bar in line with its enemy; call once per frame before draw()"""
+        bars = self._bars
+        for enemy in enemies:
+            bar = bars.get(enemy)
+            shown = enemy.active and enemy.alive and not enemy.is_dying
+            if not shown:
+                if bar is not None and bar[2] is not None:
+                    bar[0].visible = bar[1].visible = False
+                    bar[2] = None
+                continue
+
+            # position is where the sprite is drawn (interpolated), not the simulated centre
+            x, y = enemy.position
+            state = (x, y, enemy.health, enemy.max_health)
+            if bar is None:
+                bar = self._create(enemy)
+            elif bar[2] == state:
+                continue
+
+            background, foreground, previous = bar
+            x, y, health, max_health = state
+            fraction = max(0.0, min(1.0, health / max_health))
+            width = enemy.hp_bar_width
+            y += enemy.hp_bar_offset
+
+            background.position = (x, y)
+            # Foreground stays left-aligned with the background as it shrinks
+            foreground.width = width * fraction
+            foreground.position = (x - width * (1 - fraction) / 2, y)
+            if previous is None or previous[2] != health:
+                foreground.color = HP_BAR_HEALTHY if fraction > HP_BAR_LOW_FRACTION else HP_BAR_LOW
+            if previous is None:
+                background.visible = foreground.visible = True
+            bar[2] = state
+
+        # Enemies compacted out of the pool leave their bars behind; drop them in one rebuild
+        if len(bars) > len(enemies):
+            live = set(enemies)
+            for enemy in [enemy for enemy in bars if enemy not in live]:
+                del bars[enemy]
+            self.sprites.clear()
+            for background, foreground, _ in bars.values():
+                self.sprites.append(background)
+                self.sprites.append(foreground)
+
+    def draw(self):
+        self.sprites.draw()
+
+    def __len__(self):
+        return len(self._bars)
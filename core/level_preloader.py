@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from core.constants import *
+from core.asset_cache import asset_cache
+from core.event_log import event_log
+from core.map_loader import load_map_and_path
+from core.projectiles import PROJECTILE_TEXTURE_PATH
+from enemy_code.enemy import WALK_SHEET_PATH, DEATH_SHEET_PATH
+
+
+class PreloadJob:
+    """One level being loaded in the background; progress runs from 0.0 to 1.0"""
+
+    def __init__(self, level_data):
+        self.level_data = level_data
+        self.progress = 0.0
+        self.future = None
+
+    @property
+    def done(self):
+        return self.future is not None and self.future.done()
+
+    @property
+    def failed(self):
+        return self.done and self.future.exception() is not None
+
+    def result(self):
+        """The loaded map tuple (as returned by load_map_and_path), or None if not ready or failed"""
+        if not self.done or self.failed:
+            return None
+        return self.future.result()
+
+
+class LevelPreloader:
+    """Parses maps and decodes textures for levels on a worker thread.
+
+    Only CPU work happens on the worker: reading the (cached) map, building
+    lazy sprite lists and decoding images into textures. Nothing touches
+    the GL context there; sprite lists and textures are uploaded on the
+    main thread the first time they are drawn.
+    """
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-preload")
+        self.jobs = {}
+
+    def preload(self, level_data):
+        """Start loading a level (no-op if it is already loading or loaded). Returns its job."""
+        job = self.jobs.get(level_data.map_path)
+        if job is None:
+            job = PreloadJob(level_data)
+            job.future = self.executor.submit(self._load, job)
+            self.jobs[level_data.map_path] = job
+        return job
+
+    def take(self, level_data):
+        """Hand over a finished level's data; each preload can only be used once"""
+        job = self.jobs.get(level_data.map_path)
+        if job is None or not job.done:
+            return None
+        del self.jobs[level_data.map_path]
+        if job.failed:
+            event_log.error("map", "Preloading %s failed: %s", level_data.map_path, job.future.exception())
+        return job.result()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _load(job):
+        job.progress = 0.1
+        loaded = load_map_and_path(job.level_data.map_path, TILE_SCALING, quiet=True,
+                                   use_cache=MAP_CACHE_ENABLED, lazy=True)
+        job.progress = 0.7
+
+        # Warm the shared texture cache with what the first wave will need
+        asset_cache.get_texture_grid(WALK_SHEET_PATH, size=(22, 33), columns=13, count=13)
+        job.progress = 0.8
+        asset_cache.get_texture_grid(DEATH_SHEET_PATH, size=(22, 33), columns=8, count=8)
+        job.progress = 0.9
+        asset_cache.get_texture(PROJECTILE_TEXTURE_PATH)
+        job.progress = 1.0
+        return loaded
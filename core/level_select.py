@@ -2,6 +2,8 @@
 import arcade
 from core.constants import *
 from core.LevelManager import LevelManager
+from core.text_layer import TextLayer
+from core.level_preloader import LevelPreloader
 from core.game_view import TowerDefenseGame
 
 class LevelSelectView(arcade.View):
@@ -10,14 +12,19 @@ class LevelSelectView(arcade.View):
         self.hovered_level = None
         self.manager = LevelManager()
         self.levels = list(self.manager.levels.items())  # [(1, LevelData), (2, LevelData), ...]
+        self.text = TextLayer()
+        self.pending_level = None  # Clicked but still loading
+
+        # A level starts decoding in the background once it is hovered (or clicked)
+        self.preloader = LevelPreloader()
 
     def on_show(self):
         arcade.set_background_color(arcade.color.DARK_BLUE_GRAY)
 
     def on_draw(self):
         self.clear()
-        arcade.draw_text("SELECT LEVEL", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100,
-                         arcade.color.WHITE, font_size=40, anchor_x="center")
+        self.text.draw_text("title", "SELECT LEVEL", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100,
+                            arcade.color.WHITE, font_size=40, anchor_x="center")
 
         for i, (level_num, level_data) in enumerate(self.levels):
             y_pos = SCREEN_HEIGHT // 2 - (i * 100)
@@ -27,14 +34,26 @@ class LevelSelectView(arcade.View):
             bottom = y_pos - 40
             arcade.draw_lbwh_rectangle_filled(left, bottom, 300, 80, color)
 
-            arcade.draw_text(f"Level {level_num}", SCREEN_WIDTH // 2, y_pos,
-                             arcade.color.WHITE, font_size=25,
-                             anchor_x="center", anchor_y="center")
+            self.text.draw_text(("level", level_num), f"Level {level_num}", SCREEN_WIDTH // 2, y_pos,
+                                arcade.color.WHITE, font_size=25,
+                                anchor_x="center", anchor_y="center")
 
             if self.hovered_level == i:
                 arcade.draw_lbwh_rectangle_outline(left, bottom, 300, 80,
                                                    arcade.color.YELLOW, border_width=3)
 
+            # Preload progress along the bottom of the button
+            job = self.preloader.jobs.get(level_data.map_path)
+            if job and not (job.done and not job.failed):
+                bar_color = arcade.color.RED if job.failed else arcade.color.WHITE
+                arcade.draw_lbwh_rectangle_filled(left, bottom, 300 * job.progress, 6, bar_color)
+
+        if self.pending_level is not None:
+            self.text.draw_text("loading", "Loading...", SCREEN_WIDTH // 2, 100,
+                                arcade.color.WHITE, font_size=20, anchor_x="center")
+
+        self.text.draw()
+
     def on_mouse_press(self, x, y, button, modifiers):
         for i, (level_num, level_data) in enumerate(self.levels):
             y_pos = SCREEN_HEIGHT // 2 - (i * 100)
@@ -44,10 +63,25 @@ class LevelSelectView(arcade.View):
             top = bottom + 80
 
             if left <= x <= right and bottom <= y <= top:
-                game_view = TowerDefenseGame(level_data)
-                self.window.show_view(game_view)
+                # Start once the background load is done (see on_update) instead of blocking here
+                self.preloader.preload(level_data)
+                self.pending_level = level_data
+                self.on_update(0)
                 break
 
+    def on_update(self, delta_time):
+        if self.pending_level is None:
+            return
+        job = self.preloader.preload(self.pending_level)
+        if job.done:
+            # A failed preload falls back to loading in the game view itself
+            game_view = TowerDefenseGame(self.pending_level, preloaded=self.preloader.take(self.pending_level))
+            self.pending_level = None
+            self.window.show_view(game_view)
+
+    def on_hide_view(self):
+        self.preloader.shutdown()
+
     def on_mouse_motion(self, x, y, dx, dy):
         self.hovered_level = None
         for i, (level_num, level_data) in enumerate(self.levels):
@@ -58,4 +92,5 @@ class LevelSelectView(arcade.View):
             top = bottom + 80
             if left <= x <= right and bottom <= y <= top:
                 self.hovered_level = i
+                self.preloader.preload(level_data)
                 break
@@ -0,0 +1,172 @@
+import ast
+import hashlib
+import os
+import pickle
+import zlib
+from array import array
+
+import arcade
+from arcade.texture.transforms import (
+    FlipLeftRightTransform, FlipTopBottomTransform, Rotate90Transform, Rotate180Transform,
+    Rotate270Transform, TransposeTransform, TransverseTransform,
+)
+
+from core.event_log import event_log
+
+CACHE_VERSION = 2  # 2: plain data only; the PathTable is rebuilt from the path on load
+CACHE_SUFFIX = ".mapcache"
+IDENTITY_ORDER = (0, 1, 2, 3)
+TRANSFORMS = (FlipLeftRightTransform, FlipTopBottomTransform, Rotate90Transform, Rotate180Transform,
+              Rotate270Transform, TransposeTransform, TransverseTransform)
+
+
+class CompiledTileMap:
+    """Stand-in for arcade.TileMap when a map is loaded from its compiled cache.
+
+    Only carries what the game reads from a tile map: the tile layers as
+    sprite lists and the map dimensions. Object layers are not kept; the
+    spawn point and path extracted from them are stored alongside instead.
+    """
+
+    def __init__(self, sprite_lists, width, height, tile_width, tile_height):
+        self.sprite_lists = sprite_lists
+        self.object_lists = {}
+        self.width = width
+        self.height = height
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+
+
+def cache_path(map_path):
+    return map_path + CACHE_SUFFIX
+
+
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def vertex_order(texture):
+    """A texture's orientation as a vertex order tuple, from its atlas name ("<hash>|<vertex order>")"""
+    return ast.literal_eval(texture.atlas_name.rpartition("|")[2])
+
+
+def compile_map(map_path, tile_scaling, tile_map, spawn_point, enemy_path):
+    """Flatten a loaded map into plain data for the cache, or None if it can't be cached.
+
+    Each layer becomes a table of distinct textures (image file, crop and
+    orientation) plus a packed array of (texture index, x, y, angle) per
+    tile. Only builtin types are stored, never game objects, so a change to
+    a class can't leave old caches loading with a stale layout; the path
+    table is cheap to rebuild from the path points. Animated or custom tile
+    sprites are not supported and make the map uncacheable.
+    """
+    map_dir = os.path.dirname(os.path.abspath(map_path))
+    dependencies = {}
+    layers = []
+
+    for name, sprite_list in tile_map.sprite_lists.items():
+        textures = []
+        texture_index = {}
+        tiles = array("d")
+        for sprite in sprite_list:
+            texture = sprite.texture
+            if type(sprite) is not arcade.Sprite or texture.file_path is None:
+                return None
+            file_path = os.path.relpath(os.path.abspath(texture.file_path), map_dir)
+            key = (file_path, tuple(texture.crop_values), vertex_order(texture),
+                   tuple(sorted(sprite.properties.items())))
+            if key not in texture_index:
+                texture_index[key] = len(textures)
+                textures.append(key)
+                dependencies[file_path] = os.path.getmtime(os.path.join(map_dir, file_path))
+            tiles.extend((texture_index[key], sprite.center_x, sprite.center_y, sprite.angle))
+        layers.append((name, textures, tiles.tobytes()))
+
+    return {
+        "version": CACHE_VERSION,
+        "scaling": tile_scaling,
+        "mtime": os.path.getmtime(map_path),
+        "digest": file_digest(map_path),
+        "dependencies": dependencies,
+        "size": (tile_map.width, tile_map.height, tile_map.tile_width, tile_map.tile_height),
+        "spawn_point": spawn_point,
+        "enemy_path": enemy_path,
+        "layers": layers,
+    }
+
+
+def read_cache(map_path, tile_scaling):
+    """Return the compiled map if a cache exists and is still valid for the source, else None"""
+    try:
+        with open(cache_path(map_path), "rb") as f:
+            compiled = pickle.loads(zlib.decompress(f.read()))
+    except (OSError, zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    if not isinstance(compiled, dict) or compiled.get("version") != CACHE_VERSION:
+        return None
+    if compiled["scaling"] != tile_scaling:
+        return None
+
+    try:
+        # mtime is the fast path; a touched-but-identical file (checkout, copy) still hits on its hash
+        if os.path.getmtime(map_path) != compiled["mtime"] and file_digest(map_path) != compiled["digest"]:
+            return None
+        map_dir = os.path.dirname(os.path.abspath(map_path))
+        for file_path, mtime in compiled["dependencies"].items():
+            if os.path.getmtime(os.path.join(map_dir, file_path)) != mtime:
+                return None
+    except OSError:
+        return None
+    return compiled
+
+
+def write_cache(map_path, compiled):
+    """Write the compiled map next to the source. Failing to write just means no cache."""
+    path = cache_path(map_path)
+    try:
+        with open(path + ".tmp", "wb") as f:
+            f.write(zlib.compress(pickle.dumps(compiled, pickle.HIGHEST_PROTOCOL)))
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        event_log.warning("map", "Could not write map cache %s: %s", path, e)
+        return False
+    return True
+
+
+def _orient(texture, order):
+    """Apply the transforms that turn an unrotated texture into the given vertex order"""
+    if order == IDENTITY_ORDER:
+        return texture
+    for transform in TRANSFORMS:
+        if transform.transform_vertex_order(IDENTITY_ORDER) == order:
+            return texture.transform(transform)
+    return texture
+
+
+def build_tile_map(map_path, compiled, lazy=False):
+    """Recreate the tile layers of a compiled map as sprite lists"""
+    map_dir = os.path.dirname(os.path.abspath(map_path))
+    scaling = compiled["scaling"]
+    texture_cache = arcade.TextureCacheManager()
+    sprite_lists = {}
+
+    for name, texture_keys, tile_bytes in compiled["layers"]:
+        textures = []
+        for file_path, (x, y, width, height), vertex_order, properties in texture_keys:
+            texture = texture_cache.load_or_get_texture(os.path.join(map_dir, file_path),
+                                                        x=x, y=y, width=width, height=height)
+            textures.append((_orient(texture, vertex_order), dict(properties)))
+
+        tiles = array("d")
+        tiles.frombytes(tile_bytes)
+        sprite_list = arcade.SpriteList(lazy=lazy)
+        for i in range(0, len(tiles), 4):
+            texture, properties = textures[int(tiles[i])]
+            sprite = arcade.Sprite(texture, scaling, tiles[i + 1], tiles[i + 2], tiles[i + 3])
+            sprite.properties = dict(properties)
+            sprite_list.append(sprite)
+        sprite_lists[name] = sprite_list
+
+    return CompiledTileMap(sprite_lists, *compiled["size"])
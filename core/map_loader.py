@@ -1,22 +1,77 @@
 import arcade
+from core.path_table import PathTable
+from core.event_log import event_log
+from core.map_cache import build_tile_map, compile_map, read_cache, write_cache
+
+def load_map_and_path(map_path: str, tile_scaling: float, quiet: bool = False, use_cache: bool = True,
+                      lazy: bool = False):
+    """Load a TMX map into a Scene and extract the enemy spawn point and path.
+
+    Returns (tile_map, scene, spawn_point, enemy_path, path_table) where
+    path_table is the path compiled into arc-length tables for enemy movement.
+    With use_cache, a valid compiled cache next to the map is loaded instead
+    of parsing the TMX (tile_map is then a CompiledTileMap), and a fresh
+    parse writes one. quiet silences the per-layer/per-object debug output.
+    lazy defers all GL work on the sprite lists to their first draw, which
+    makes the call safe from a worker thread.
+    """
+    compiled = read_cache(map_path, tile_scaling) if use_cache else None
+
+    if compiled is not None:
+        tile_map = build_tile_map(map_path, compiled, lazy)
+        spawn_point = compiled["spawn_point"]
+        enemy_path = compiled["enemy_path"]
+        path_table = PathTable(enemy_path)
+        if not quiet:
+            event_log.debug("map", "Loaded compiled map cache for %s", map_path)
+    else:
+        tile_map = arcade.load_tilemap(map_path, scaling=tile_scaling, lazy=lazy)
+        spawn_point, enemy_path = extract_path(tile_map, quiet)
+        path_table = PathTable(enemy_path)
+        if use_cache:
+            compiled = compile_map(map_path, tile_scaling, tile_map, spawn_point, enemy_path)
+            if compiled is not None:
+                write_cache(map_path, compiled)
 
-def load_map_and_path(map_path: str, tile_scaling: float):
-    tile_map = arcade.load_tilemap(map_path, scaling=tile_scaling)
     scene = arcade.Scene()
 
     # Add all tile layers to the scene
     for layer_name, sprite_list in tile_map.sprite_lists.items():
         scene.add_sprite_list(name=layer_name, sprite_list=sprite_list)
-        print(f"[DEBUG] Added tile layer to scene: {layer_name}")
+        if not quiet:
+            event_log.debug("map", "Added tile layer to scene: %s", layer_name)
+
+    return tile_map, scene, spawn_point, enemy_path, path_table
+
 
+def load_path(map_path: str, tile_scaling: float, use_cache: bool = True):
+    """Return only (spawn_point, enemy_path, path_table) for a map.
+
+    Served straight from the compiled cache when it is valid, without
+    building any sprites; otherwise the map is loaded (and cached) quietly.
+    """
+    compiled = read_cache(map_path, tile_scaling) if use_cache else None
+    if compiled is not None:
+        return compiled["spawn_point"], compiled["enemy_path"], PathTable(compiled["enemy_path"])
+
+    _, _, spawn_point, enemy_path, path_table = load_map_and_path(map_path, tile_scaling, quiet=True,
+                                                                  use_cache=use_cache)
+    return spawn_point, enemy_path, path_table
+
+
+def extract_path(tile_map, quiet=False):
+    """Find the spawn point and the enemy path polyline in the map's "Path" object layer"""
     spawn_point = (0, 0)
     enemy_path = []
 
     path_layer = tile_map.object_lists.get("Path", [])
-    print(f"[DEBUG] Path layer contains {len(path_layer)} objects.")
+    if not quiet:
+        event_log.debug("map", "Path layer contains %s objects.", len(path_layer))
 
     for obj in path_layer:
-        print(f"[DEBUG] Object raw data: name='{obj.name}', type='{obj.type}', shape={getattr(obj, 'shape', None)}, x={getattr(obj, 'x', None)}, y={getattr(obj, 'y', None)}")
+        if not quiet:
+            event_log.debug("map", "Object raw data: name='%s', type='%s', shape=%s, x=%s, y=%s", obj.name, obj.type,
+                            getattr(obj, 'shape', None), getattr(obj, 'x', None), getattr(obj, 'y', None))
 
         if obj.name and obj.name.strip().lower() == "starting point":
             shape = getattr(obj, "shape", None)
@@ -27,18 +82,20 @@ def load_map_and_path(map_path: str, tile_scaling: float):
                 center_x = sum(xs) / 4
                 center_y = sum(ys) / 4
                 spawn_point = (center_x, center_y)
-                print(f"[DEBUG] Rectangle 'starting point' center: {spawn_point}")
+                if not quiet:
+                    event_log.debug("map", "Rectangle 'starting point' center: %s", spawn_point)
             else:
-                print(f"[WARNING] Unrecognized shape for 'starting point': {shape}")
+                event_log.warning("map", "Unrecognized shape for 'starting point': %s", shape)
 
         elif obj.name and obj.name.strip().lower() == "path":
             shape = getattr(obj, "shape", None)
             if isinstance(shape, list) and shape:
                 enemy_path = shape
-                print(f"[DEBUG] Path to follow: {enemy_path}")
+                if not quiet:
+                    event_log.debug("map", "Path to follow: %s", enemy_path)
             else:
-                print("[WARNING] Path object has no valid shape")
+                event_log.warning("map", "Path object has no valid shape")
+
 
-                
     enemy_path = [spawn_point] + enemy_path
-    return tile_map, scene, spawn_point, enemy_path
+    return spawn_point, enemy_path
@@ -0,0 +1,54 @@
+from arcade.shape_list import ShapeElementList, create_ellipse_outline
+
+_UNBUILT = object()
+
+
+class OverlayLayer:
+    """Immediate-mode overlay geometry baked into a ShapeElementList.
+
+    update() takes a key describing what the layer should show and a
+    function that builds the shapes. The shapes are only rebuilt (and
+    re-uploaded) when the key changes; otherwise the layer is one draw call
+    of geometry already on the GPU. Layers built around the origin can be
+    moved with position instead of being rebuilt.
+    """
+
+    def __init__(self):
+        self.shapes = None  # Created on first update, once a window (GL context) exists
+        self.key = _UNBUILT
+        self._position = (0, 0)
+        self.count = 0
+        self.rebuilds = 0
+
+    def update(self, key, build):
+        """Rebuild the shapes from build() if key differs from the last build"""
+        if key == self.key:
+            return False
+        self.shapes = ShapeElementList()
+        self.shapes.position = self._position
+        self.count = 0
+        for shape in build():
+            self.shapes.append(shape)
+            self.count += 1
+        self.key = key
+        self.rebuilds += 1
+        return True
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._position = value
+        if self.shapes is not None:
+            self.shapes.position = value
+
+    def draw(self):
+        if self.count:
+            self.shapes.draw()
+
+
+def range_circle(x, y, radius, color, border_width=1):
+    """Outline circle shape for a tower range"""
+    return create_ellipse_outline(x, y, radius * 2, radius * 2, color, border_width, num_segments=64)
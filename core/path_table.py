@@ -0,0 +1,86 @@
+import bisect
+import math
+
+
+class PathTable:
+    """Enemy path polyline compiled into cumulative arc-length tables.
+
+    cumulative[i] is the distance along the path at points[i], and
+    directions[i] is the unit vector of the segment from points[i] to
+    points[i + 1]. An enemy only needs the distance it has travelled;
+    position() turns that into (x, y) with a table lookup, no sqrt.
+    """
+
+    def __init__(self, points):
+        self.points = [(float(x), float(y)) for x, y in points]
+        self.cumulative = [0.0]
+        self.directions = []
+
+        for (x0, y0), (x1, y1) in zip(self.points, self.points[1:]):
+            length = math.hypot(x1 - x0, y1 - y0)
+            if length > 0:
+                self.directions.append(((x1 - x0) / length, (y1 - y0) / length))
+            else:
+                self.directions.append((0.0, 0.0))
+            self.cumulative.append(self.cumulative[-1] + length)
+
+        self.total_length = self.cumulative[-1]
+
+    def segment_at(self, distance):
+        """Index of the segment that contains the given distance"""
+        index = bisect.bisect_right(self.cumulative, distance) - 1
+        return min(max(index, 0), len(self.directions) - 1)
+
+    def position(self, distance):
+        """(x, y) at a distance along the path, clamped to its ends"""
+        if not self.directions:
+            return self.points[0] if self.points else (0.0, 0.0)
+
+        distance = min(max(distance, 0.0), self.total_length)
+        index = self.segment_at(distance)
+        x0, y0 = self.points[index]
+        ux, uy = self.directions[index]
+        along = distance - self.cumulative[index]
+        return x0 + ux * along, y0 + uy * along
+
+    def direction(self, distance):
+        """Unit direction of travel at a distance along the path"""
+        if not self.directions:
+            return 0.0, 0.0
+        return self.directions[self.segment_at(distance)]
+
+    def coverage(self, x, y, radius):
+        """Distance intervals [(start, end), ...] where the path is within radius of (x, y).
+
+        Solved exactly per segment (circle against line segment), with
+        touching intervals merged, in path order.
+        """
+        intervals = []
+        radius_sq = radius * radius
+        for index, (ux, uy) in enumerate(self.directions):
+            x0, y0 = self.points[index]
+            length = self.cumulative[index + 1] - self.cumulative[index]
+            # |p0 + t*u - c|^2 <= r^2  ->  t^2 + 2bt + c <= 0
+            b = ux * (x0 - x) + uy * (y0 - y)
+            c = (x0 - x) ** 2 + (y0 - y) ** 2 - radius_sq
+            disc = b * b - c
+            if disc < 0:
+                continue
+            root = math.sqrt(disc)
+            start = max(-b - root, 0.0)
+            end = min(-b + root, length)
+            if start > end:
+                continue
+            start += self.cumulative[index]
+            end += self.cumulative[index]
+            if intervals and start <= intervals[-1][1]:
+                intervals[-1] = (intervals[-1][0], max(intervals[-1][1], end))
+            else:
+                intervals.append((start, end))
+        return intervals
+
+    def __len__(self):
+        return len(self.points)
+
+    def __iter__(self):
+        return iter(self.points)
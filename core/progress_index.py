@@ -0,0 +1,90 @@
+import bisect
+from operator import attrgetter
+
+_by_distance = attrgetter("distance")
+
+
+class ProgressIndex:
+    """Living enemies kept in order of how far along the path they are.
+
+    Enemies are added on spawn and dropped when they are killed or leak.
+    The order is carried over from tick to tick: refresh() re-reads the
+    distances and re-sorts, which is close to linear because enemies only
+    occasionally overtake each other (timsort merges the existing runs).
+    It only runs when a query needs it after the enemies have moved.
+
+    Because every enemy stands on the path at its distance, "which enemies
+    can this tower hit" is a set of distance intervals (see
+    PathTable.coverage) and each one is two bisections into the order.
+    """
+
+    def __init__(self):
+        self.enemies = []  # ascending distance
+        self.distances = []
+        self._gone = set()
+        self.stale = False
+
+    def add(self, enemy):
+        if enemy in self._gone:
+            # A pooled enemy reused before the index dropped it: it is still in the list
+            self._gone.discard(enemy)
+        else:
+            self.enemies.append(enemy)
+        self.stale = True
+
+    def remove(self, enemy):
+        """Drop an enemy (killed or leaked); it is skipped now and forgotten on the next refresh"""
+        self._gone.add(enemy)
+        self.stale = True
+
+    def refresh(self):
+        if not self.stale:
+            return
+        enemies = self.enemies
+        if self._gone:
+            gone = self._gone
+            enemies = self.enemies = [enemy for enemy in enemies if enemy not in gone]
+            gone.clear()
+        enemies.sort(key=_by_distance)
+        self.distances = [enemy.distance for enemy in enemies]
+        self.stale = False
+
+    def _targetable(self, enemy):
+        return enemy.alive and not enemy.is_dying and enemy not in self._gone
+
+    def furthest(self, intervals):
+        """The enemy furthest along the path inside any of the intervals, or None"""
+        self.refresh()
+        enemies, distances = self.enemies, self.distances
+        # Intervals are in path order, so the last one with a living enemy wins
+        for start, end in reversed(intervals):
+            low = bisect.bisect_left(distances, start)
+            for i in range(bisect.bisect_right(distances, end) - 1, low - 1, -1):
+                if self._targetable(enemies[i]):
+                    return enemies[i]
+        return None
+
+    def nearest_start(self, intervals):
+        """The enemy least far along the path inside any of the intervals, or None"""
+        self.refresh()
+        enemies, distances = self.enemies, self.distances
+        for start, end in intervals:
+            high = bisect.bisect_right(distances, end)
+            for i in range(bisect.bisect_left(distances, start), high):
+                if self._targetable(enemies[i]):
+                    return enemies[i]
+        return None
+
+    def within(self, intervals):
+        """Every targetable enemy inside the intervals, in path order"""
+        self.refresh()
+        enemies, distances = self.enemies, self.distances
+        found = []
+        for start, end in intervals:
+            low = bisect.bisect_left(distances, start)
+            high = bisect.bisect_right(distances, end)
+            found.extend(enemy for enemy in enemies[low:high] if self._targetable(enemy))
+        return found
+
+    def __len__(self):
+        return len(self.enemies) - len(self._gone)
@@ -0,0 +1,157 @@
+import arcade
+import numpy as np
+from core.asset_cache import asset_cache
+from core.events import PROJECTILE_EXPIRED
+
+PROJECTILE_TEXTURE_PATH = ":resources:images/space_shooter/laserBlue01.png"
+PROJECTILE_SCALE = 0.5
+HIT_DISTANCE = 10
+
+
+class ProjectilePool:
+    """Every projectile in flight, stored in preallocated array-backed slots.
+
+    Position, speed and damage live in NumPy arrays and the homing move and
+    hit test run as one vectorized step per tick. Each slot owns a sprite in
+    a single shared SpriteList, so all projectiles are drawn with one draw
+    call no matter how many towers fired them. Free slots are hidden, not
+    removed.
+
+    Every target in flight is alive: when an enemy is killed or leaks,
+    expire_target() drops the projectiles chasing it straight away (and
+    emits projectile_expired), so update() never has to check targets.
+    """
+
+    def __init__(self, capacity=256, events=None):
+        self.events = events
+        self.capacity = 0
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.prev_x = np.zeros(0)
+        self.prev_y = np.zeros(0)
+        self.speed = np.zeros(0)
+        self.damage = np.zeros(0)
+        self.active = np.zeros(0, dtype=bool)
+        self.targets = []
+        self.tower_types = []
+        self.free_slots = []
+        self.by_target = {}  # enemy -> slots of the projectiles chasing it
+        self.sprites = arcade.SpriteList()
+        self.count = 0
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        """Add slots (and their hidden sprites) up to the new capacity"""
+        for name in ("x", "y", "prev_x", "prev_y", "speed", "damage", "active"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+        texture = asset_cache.get_texture(PROJECTILE_TEXTURE_PATH)
+        for _ in range(self.capacity, capacity):
+            sprite = arcade.Sprite(texture, PROJECTILE_SCALE)
+            sprite.visible = False
+            self.sprites.append(sprite)
+            self.targets.append(None)
+            self.tower_types.append(None)
+        self.free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def fire(self, x, y, target, damage, speed, tower_type=None):
+        """Launch a homing projectile at a target. Returns its slot."""
+        if not self.free_slots:
+            self._grow(self.capacity * 2)
+        slot = self.free_slots.pop()
+        self.x[slot] = self.prev_x[slot] = x
+        self.y[slot] = self.prev_y[slot] = y
+        self.damage[slot] = damage
+        self.speed[slot] = speed
+        self.active[slot] = True
+        self.targets[slot] = target
+        self.tower_types[slot] = tower_type
+        self.by_target.setdefault(target, []).append(slot)
+
+        sprite = self.sprites[slot]
+        sprite.position = (x, y)
+        sprite.visible = True
+        self.count += 1
+        return slot
+
+    def release(self, slot):
+        """Return a slot to the free list and hide its sprite"""
+        chasing = self.by_target[self.targets[slot]]
+        chasing.remove(slot)
+        if not chasing:
+            del self.by_target[self.targets[slot]]
+        self._free(slot)
+
+    def _free(self, slot):
+        self.active[slot] = False
+        self.targets[slot] = None
+        self.sprites[slot].visible = False
+        self.free_slots.append(slot)
+        self.count -= 1
+
+    def expire_target(self, enemy):
+        """Drop every projectile chasing an enemy that was just killed or leaked"""
+        for slot in self.by_target.pop(enemy, ()):
+            self._free(slot)
+            if self.events is not None:
+                self.events.emit(PROJECTILE_EXPIRED, slot, enemy)
+
+    def update(self, delta_time):
+        """Move every projectile towards its target and apply damage on hit"""
+        if not self.count:
+            return
+
+        slots = np.flatnonzero(self.active)
+        targets = [self.targets[slot] for slot in slots.tolist()]
+        n = len(targets)
+
+        # Gather target positions once; only this part is per-projectile Python
+        target_x = np.fromiter((t.center_x for t in targets), dtype=np.float64, count=n)
+        target_y = np.fromiter((t.center_y for t in targets), dtype=np.float64, count=n)
+
+        dx = target_x - self.x[slots]
+        dy = target_y - self.y[slots]
+        distance = np.hypot(dx, dy)
+        step = self.speed[slots] * delta_time
+        scale = np.divide(step, distance, out=np.zeros_like(distance), where=distance > 0)
+        self.prev_x[slots] = self.x[slots]
+        self.prev_y[slots] = self.y[slots]
+        self.x[slots] += dx * scale
+        self.y[slots] += dy * scale
+
+        for i in np.flatnonzero(distance < HIT_DISTANCE).tolist():
+            slot = slots[i].item()
+            # An earlier hit this tick may have killed the target and expired this projectile
+            if not self.active[slot]:
+                continue
+            damage = self.damage[slot].item()
+            # Recycle before the hit, so a kill doesn't expire the projectile that made it
+            self.release(slot)
+            targets[i].take_damage(damage)
+
+    def sync_sprites(self, alpha=None):
+        """Copy projectile positions into their sprites for rendering.
+
+        With an alpha, each projectile is drawn that far between its previous
+        and current simulated positions.
+        """
+        slots = np.flatnonzero(self.active)
+        x = self.x[slots]
+        y = self.y[slots]
+        if alpha is not None:
+            x = self.prev_x[slots] + (x - self.prev_x[slots]) * alpha
+            y = self.prev_y[slots] + (y - self.prev_y[slots]) * alpha
+
+        sprites = self.sprites
+        for slot, x, y in zip(slots.tolist(), x.tolist(), y.tolist()):
+            sprites[slot].position = (x, y)
+
+    def draw(self):
+        self.sprites.draw()
+
+    def __len__(self):
+        return self.count
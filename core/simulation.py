@@ -0,0 +1,313 @@
+import arcade
+import random
+import time
+from core.constants import *
+from core.event_log import event_log
+from core.events import EventBus, ENEMY_KILLED, ENEMY_LEAKED, ENEMY_REMOVED
+from core.map_loader import load_path
+from core.spatial_index import EnemyGrid
+from core.progress_index import ProgressIndex
+from core.projectiles import ProjectilePool
+from core.wave_timeline import WaveTimeline
+from core.gamble import apply_gamble, roll_gamble
+from enemy_code.enemy_types import enemy_stats
+from enemy_code.enemy_store import EnemyStore
+from enemy_code.enemy_pool import EnemyPool
+from tower_code.Tower import Tower
+from tower_code.targeting import TARGETING_MODES, TargetSelector
+
+
+class Simulation:
+    """Window-free game rules: spawning, waves, enemy movement, tower attacks and rewards.
+
+    TowerDefenseGame renders on top of this. Headless runs (CI, benchmarks)
+    can build one with from_level() and call step() as fast as the CPU allows;
+    nothing here needs a window or a GL context.
+
+    Kills, leaks and removals are published on self.events the moment
+    they happen; rewards, lives, wave bookkeeping and projectile cleanup
+    are handlers subscribed to them, so nothing scans for finished enemies.
+
+    Player actions go through execute() so they are applied between ticks
+    and can be recorded; with the same seed and the same commands at the
+    same ticks, a run is reproduced exactly (see core/replay.py).
+    """
+
+    def __init__(self, level_data, spawn_point, path_table, placements=(), use_enemy_store=False, seed=None):
+        self.level_data = level_data
+        # All game-rule randomness comes from this RNG, never the global one
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.recorder = None  # Set to an InputRecorder to log executed commands
+        self.money = level_data.money_start
+        self.lives = level_data.lives
+        self.waves = level_data.waves
+        self.spawn_point = spawn_point
+        self.path_table = path_table
+        self.enemy_path = path_table.points
+
+        self.events = EventBus()
+
+        # Targeting goes through enemy_grid, so the sprite list doesn't need
+        # arcade's spatial hash (which re-buckets on every single move)
+        self.enemies = arcade.SpriteList()
+        self.towers = arcade.SpriteList()
+        self.enemy_grid = EnemyGrid()
+        self.projectiles = ProjectilePool(events=self.events)
+
+        # Optional NumPy structure-of-arrays backend for enemy state. Towers
+        # query it directly, so the grid isn't needed when it is enabled.
+        self.enemy_store = None
+        self.enemy_index = self.enemy_grid
+        if use_enemy_store:
+            self.enemy_store = EnemyStore(path_table)
+            self.enemy_index = self.enemy_store
+
+        # Living enemies in path order, for first/last/strongest/weakest targeting
+        self.progress_index = ProgressIndex()
+        self.targeting = TargetSelector(path_table, self.progress_index, self.enemy_index)
+
+        # Retired enemies are parked in the pool (still in self.enemies, hidden)
+        # and handed back out on spawn; enemy_count tracks the ones in play
+        self.enemy_pool = EnemyPool(self.enemies, self.enemy_store)
+        self.enemy_count = 0
+        self.retired_enemies = []
+
+        self.tick = 0
+        self.time = 0.0
+        self.level_complete = False
+
+        # Every spawn of every wave, in time order
+        self.timeline = WaveTimeline(self.waves)
+
+        self.commands = {
+            "place_tower": self.place_tower,
+            "upgrade": self.upgrade_tower,
+            "gamble": self.gamble_tower,
+            "pause": self.set_paused,
+            "targeting": self.set_targeting,
+        }
+
+        self.events.subscribe(ENEMY_KILLED, self.on_enemy_killed)
+        self.events.subscribe(ENEMY_KILLED, self.projectiles.expire_target)
+        self.events.subscribe(ENEMY_LEAKED, self.on_enemy_leaked)
+        self.events.subscribe(ENEMY_LEAKED, self.projectiles.expire_target)
+        self.events.subscribe(ENEMY_KILLED, self.progress_index.remove)
+        self.events.subscribe(ENEMY_LEAKED, self.progress_index.remove)
+        self.events.subscribe(ENEMY_REMOVED, self.on_enemy_removed)
+
+        # Order matters: towers target enemies after they have moved
+        self.phases = [
+            ("spawn", self.update_spawning),
+            ("enemies", self.update_enemies),
+            ("waves", self.update_waves),
+            ("towers", self.update_towers),
+            ("projectiles", self.update_projectiles),
+        ]
+
+        for tower_type, x, y in placements:
+            self.place_tower(tower_type, x, y)
+
+    @classmethod
+    def from_level(cls, level_data, placements=(), **kwargs):
+        """Load the level's map and build a simulation for it"""
+        spawn_point, _, path_table = load_path(level_data.map_path, TILE_SCALING, use_cache=MAP_CACHE_ENABLED)
+        return cls(level_data, spawn_point, path_table, placements, **kwargs)
+
+    def execute(self, command, *args):
+        """Apply a player command before the next tick (recording it if a recorder is attached)"""
+        if self.recorder is not None:
+            self.recorder.record(self.tick, command, args)
+        return self.commands[command](*args)
+
+    def place_tower(self, tower_type, x, y, image_path=TOWER_IMAGE_PATH, scale=TOWER_ICON_SCALE):
+        """Build a tower at (x, y) if it can be afforded. Returns the tower or None."""
+        tower = Tower(tower_type=tower_type, image_path=image_path, scale=scale)
+        tower.center_x = x
+        tower.center_y = y
+
+        tower_cost = tower.get_cost()
+        if self.money < tower_cost:
+            return None
+        self.money -= tower_cost
+        self.towers.append(tower)
+        return tower
+
+    def upgrade_tower(self, tower_index, path):
+        """Pay for and apply one upgrade along a path.
+
+        Returns None if it can't be afforded, and False (charging nothing) if
+        the tower is maxed or already committed to another path.
+        """
+        tower = self.towers[tower_index]
+        if not tower.can_upgrade() or tower.upgrade_path not in (None, path):
+            return False
+        upgrade_cost = tower.get_upgrade_cost()
+        if self.money < upgrade_cost:
+            return None
+        self.money -= upgrade_cost
+        return tower.upgrade(path, self.rng)
+
+    def gamble_tower(self, tower_index):
+        """Pay the upgrade cost and spin the gamble wheel.
+
+        Returns the outcome, None if it can't be afforded, or False (charging
+        nothing) if the tower is already at max level.
+        """
+        tower = self.towers[tower_index]
+        if not tower.can_upgrade():
+            return False
+        upgrade_cost = tower.get_upgrade_cost()
+        if self.money < upgrade_cost:
+            return None
+        self.money -= upgrade_cost
+        result = roll_gamble(self.rng)
+        self.money += apply_gamble(tower, result, upgrade_cost)
+        return result
+
+    def set_targeting(self, tower_index, mode):
+        """Switch a tower's targeting mode; it picks a new target on its next attack"""
+        if mode not in TARGETING_MODES:
+            raise ValueError(f"Unknown targeting mode {mode!r}")
+        tower = self.towers[tower_index]
+        tower.targeting = mode
+        tower.current_target = None
+
+    def set_paused(self, paused):
+        """Only recorded, so replays show when the player paused; the view just stops stepping meanwhile"""
+        return paused
+
+    def spawn_enemy(self, enemy_type=None, wave=None, distance=0.0):
+        """Spawn one enemy at the start of the path.
+
+        wave is the index of the wave it belongs to (None for enemies placed
+        by hand), and distance starts it that far along the path.
+        """
+        enemy = self.enemy_pool.acquire(self.spawn_point, self.path_table, **enemy_stats(enemy_type))
+        enemy.wave = wave
+        enemy.events = self.events
+        if distance > 0:
+            enemy.distance = enemy.prev_distance = distance
+            enemy.center_x, enemy.center_y = self.path_table.position(distance)
+        self.progress_index.add(enemy)
+        self.enemy_count += 1
+        return enemy
+
+    def step(self, delta_time, timings=None):
+        """Advance the simulation by one tick.
+
+        If a timings dict is given, the wall time of each phase (in seconds)
+        is appended to timings[phase_name].
+        """
+        if timings is None:
+            for name, phase in self.phases:
+                phase(delta_time)
+        else:
+            for name, phase in self.phases:
+                start = time.perf_counter()
+                phase(delta_time)
+                timings.setdefault(name, []).append(time.perf_counter() - start)
+        self.end_tick()
+        self.tick += 1
+        self.time += delta_time
+
+    def end_tick(self):
+        """Return this tick's finished enemies to the pool in one batch"""
+        if not self.retired_enemies:
+            return
+        for enemy in self.retired_enemies:
+            self.enemy_pool.release(enemy)
+        self.enemy_count -= len(self.retired_enemies)
+        self.retired_enemies.clear()
+        self.enemy_pool.compact()
+
+    def sync_sprites(self, alpha=None):
+        """Bring sprites up to date before drawing.
+
+        alpha (0..1) is how far the renderer is into the next fixed step;
+        when given, moving sprites are drawn between their last two
+        simulated positions. None draws the simulated positions as they are.
+        """
+        self.projectiles.sync_sprites(alpha)
+        if self.enemy_store is not None:
+            self.enemy_store.sync_sprites(alpha)
+        elif alpha is not None:
+            for enemy in self.enemies:
+                if enemy.active and not enemy.is_dying:
+                    enemy.interpolate(alpha)
+
+    def run(self, ticks, delta_time=1 / 60):
+        """Advance the simulation by a number of ticks, stopping early once the level is over"""
+        for _ in range(ticks):
+            if self.is_over():
+                break
+            self.step(delta_time)
+        return self.tick
+
+    def is_over(self):
+        return self.level_complete or self.lives <= 0
+
+    @property
+    def current_wave(self):
+        return self.timeline.current_wave
+
+    def update_spawning(self, delta_time):
+        """Spawn every enemy whose time has come since the last tick, however many that is"""
+        for wave, spawn_time in self.timeline.due(self.time):
+            # Spawns land between ticks; start each one as far along as it
+            # would have walked since its exact spawn time
+            speed = enemy_stats(wave.enemy_type)["speed"]
+            self.spawn_enemy(wave.enemy_type, wave.index, speed * (self.time - spawn_time))
+
+    def update_enemies(self, delta_time):
+        """Update enemies individually to handle death animations"""
+        if self.enemy_store is not None:
+            self.enemy_store.update(delta_time)
+            return
+        for enemy in self.enemies:
+            enemy.update(delta_time)
+
+    def update_waves(self, delta_time):
+        """Finish the level once every wave is cleared and nothing is left on the map"""
+        if not self.level_complete and self.timeline.finished and not self.enemy_count:
+            self.level_complete = True
+            event_log.info("sim", "Level complete!")
+
+    def on_enemy_killed(self, enemy):
+        """Pay the reward as soon as the enemy dies"""
+        self.money += enemy.reward
+        event_log.debug("sim", "Enemy killed! +%s gold", enemy.reward)
+
+    def on_enemy_leaked(self, enemy):
+        """Lose a life; several leaks in one tick can't take lives below zero"""
+        if self.lives == 0:
+            return
+        self.lives -= 1
+        event_log.info("sim", "Enemy leaked! %s lives left", self.lives)
+        if self.lives == 0:
+            event_log.info("sim", "Game over!")
+
+    def on_enemy_removed(self, enemy):
+        """Count the enemy out of its wave and retire it"""
+        if enemy.wave is not None:
+            self.timeline.enemy_removed(enemy.wave, self.time)
+        # Removal is deferred to end_tick() so the lists aren't changed mid-tick
+        self.retired_enemies.append(enemy)
+
+    def update_towers(self, delta_time):
+        """Update all towers and handle their attacks"""
+        # Index living (not dying) enemies once per tick for every tower's range query
+        self.enemy_index.rebuild(self.enemies)
+        self.progress_index.stale = True
+
+        for tower in self.towers:
+            # Update the tower (cooldowns, etc.)
+            tower.update(delta_time)
+
+            if self.enemy_index.count:
+                # Make the tower attack if possible
+                tower.attack(delta_time, self.targeting, self.projectiles)
+
+    def update_projectiles(self, delta_time):
+        """Move every projectile in flight and apply hits"""
+        self.projectiles.update(delta_time)
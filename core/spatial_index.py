@@ -0,0 +1,80 @@
+class EnemyGrid:
+    """Uniform grid of living enemies, rebuilt once per tick for tower range queries.
+
+    Each enemy is bucketed by the cell its center falls in, so a range query
+    only looks at the cells the range circle overlaps. Distances are compared
+    squared; no sqrt is taken. Enemies killed after the rebuild are skipped.
+    """
+
+    def __init__(self, cell_size=100):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+
+    def rebuild(self, enemies):
+        """Re-bucket every living (not dying) enemy"""
+        cells = {}
+        cell_size = self.cell_size
+        count = 0
+        for enemy in enemies:
+            if not enemy.alive or enemy.is_dying:
+                continue
+            key = (int(enemy.center_x // cell_size), int(enemy.center_y // cell_size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [enemy]
+            else:
+                bucket.append(enemy)
+            count += 1
+        self.cells = cells
+        self.count = count
+
+    def _buckets(self, x, y, radius):
+        """Yield the non-empty buckets of every cell the circle's bounding box covers"""
+        cell_size = self.cell_size
+        cells = self.cells
+        min_cx = int((x - radius) // cell_size)
+        max_cx = int((x + radius) // cell_size)
+        min_cy = int((y - radius) // cell_size)
+        max_cy = int((y + radius) // cell_size)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield bucket
+
+    def query(self, x, y, radius):
+        """Return [(enemy, distance_squared), ...] for every enemy within radius of (x, y)"""
+        radius_sq = radius * radius
+        found = []
+        for bucket in self._buckets(x, y, radius):
+            for enemy in bucket:
+                # Enemies can die mid-tick after the grid was built
+                if not enemy.alive:
+                    continue
+                dx = enemy.center_x - x
+                dy = enemy.center_y - y
+                dist_sq = dx * dx + dy * dy
+                if dist_sq <= radius_sq:
+                    found.append((enemy, dist_sq))
+        return found
+
+    def nearest(self, x, y, radius):
+        """Return the closest enemy within radius of (x, y), or None"""
+        best = None
+        best_dist_sq = radius * radius
+        for bucket in self._buckets(x, y, radius):
+            for enemy in bucket:
+                # Enemies can die mid-tick after the grid was built
+                if not enemy.alive:
+                    continue
+                dx = enemy.center_x - x
+                dy = enemy.center_y - y
+                dist_sq = dx * dx + dy * dy
+                if dist_sq < best_dist_sq or (best is None and dist_sq == best_dist_sq):
+                    best = enemy
+                    best_dist_sq = dist_sq
+        return best
+
+    def __len__(self):
+        return self.count
@@ -0,0 +1,71 @@
+import arcade
+import pyglet
+
+
+class TextLayer:
+    """Retained arcade.Text objects for one piece of UI, drawn as one batch.
+
+    Call draw_text() with the same arguments as arcade.draw_text plus a key
+    that names the label (e.g. "money" or ("level", 3)). The first call
+    builds an arcade.Text in this layer's batch; later calls only touch the
+    properties that actually changed, so an unchanged string is never laid
+    out again. Labels that were not asked for since the last draw() are
+    hidden, which keeps the immediate-mode "draw what you call" behaviour.
+
+    Each UI component owns its own layer so its text still lands on top of
+    its own shapes and underneath whatever is drawn after it.
+    """
+
+    def __init__(self):
+        self.batch = pyglet.graphics.Batch()
+        self._labels = {}  # key -> [Text, style, (text, x, y, color, font_size, rotation), visible]
+        self._used = set()
+
+    def draw_text(self, key, text, x, y, color=arcade.color.WHITE, font_size=12, rotation=0, **style):
+        """Queue a label for the next draw(), creating or updating it as needed"""
+        text = str(text)
+        color = arcade.types.Color.from_iterable(color)
+        state = (text, x, y, color, font_size, rotation)
+        entry = self._labels.get(key)
+
+        if entry is not None and entry[1] != style:
+            # Layout options (anchor, width, bold, ...) changed: rebuild the label
+            entry[0].label.delete()
+            entry = None
+
+        if entry is None:
+            label = arcade.Text(text, x, y, color, font_size, rotation=rotation, batch=self.batch, **style)
+            entry = self._labels[key] = [label, style, state, True]
+        elif entry[2] != state:
+            label, _, (old_text, old_x, old_y, old_color, old_size, old_rotation), _ = entry
+            if old_text != text:
+                label.text = text
+            if old_x != x or old_y != y:
+                label.position = (x, y)
+            if old_color != color:
+                label.color = color
+            if old_size != font_size:
+                label.font_size = font_size
+            if old_rotation != rotation:
+                label.rotation = rotation
+            entry[2] = state
+
+        if not entry[3]:
+            entry[0].visible = entry[3] = True
+        self._used.add(key)
+        return entry[0]
+
+    def draw(self):
+        """Hide labels that were not requested since the last draw, then draw the batch"""
+        for key, entry in self._labels.items():
+            if entry[3] and key not in self._used:
+                entry[0].visible = entry[3] = False
+        self._used.clear()
+        self.batch.draw()
+
+    def clear(self):
+        """Forget every label (e.g. when the view is torn down)"""
+        for entry in self._labels.values():
+            entry[0].label.delete()
+        self._labels.clear()
+        self._used.clear()
@@ -0,0 +1,76 @@
+import arcade
+from arcade.gl import geometry
+from core.event_log import event_log
+
+_VERTEX_SHADER = """
+#version 330
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 uv;
+void main() {
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+    uv = in_uv;
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 330
+uniform sampler2D tiles;
+in vec2 uv;
+out vec4 color;
+void main() {
+    color = texture(tiles, uv);
+}
+"""
+
+
+class BakedTileLayers:
+    """Static tile layers pre-rendered into one texture and drawn as one quad.
+
+    The tile sprite lists are drawn once into an offscreen framebuffer the
+    size of the window, and its color texture is drawn straight to the
+    screen as a full-window quad from then on. Nothing goes through the
+    texture atlas or back to the CPU, so re-baking costs no atlas space.
+    The original sprite lists are kept so the bake can be redone when the
+    window size changes.
+    """
+
+    def __init__(self, sprite_lists):
+        self.sprite_lists = list(sprite_lists)
+        self.fbo = None
+        self.size = None
+        self.bakes = 0
+        self._program = None
+        self._quad = None
+
+    def bake(self, width, height):
+        """Render the tile layers into a width x height framebuffer"""
+        ctx = arcade.get_window().ctx
+        if self.size != (width, height):
+            # The old framebuffer is freed by the context's GC once unreferenced
+            texture = ctx.texture((width, height), components=4)
+            texture.filter = ctx.NEAREST, ctx.NEAREST
+            self.fbo = ctx.framebuffer(color_attachments=[texture])
+        camera = arcade.Camera2D(render_target=self.fbo)
+        with camera.activate():
+            self.fbo.clear()
+            for sprite_list in self.sprite_lists:
+                sprite_list.draw()
+        self.bakes += 1
+        self.size = (width, height)
+        event_log.debug("map", "Baked %s tile layers into a %sx%s texture", len(self.sprite_lists), width, height)
+
+    def ensure(self, width, height):
+        """Bake if nothing is baked yet or the target size changed"""
+        if self.size != (width, height):
+            self.bake(width, height)
+
+    def draw(self):
+        if self.fbo is None:
+            return
+        if self._program is None:
+            ctx = arcade.get_window().ctx
+            self._program = ctx.program(vertex_shader=_VERTEX_SHADER, fragment_shader=_FRAGMENT_SHADER)
+            self._quad = geometry.quad_2d_fs()
+        self.fbo.color_attachments[0].use(0)
+        self._quad.render(self._program)
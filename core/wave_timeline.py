@@ -0,0 +1,106 @@
+import heapq
+from core.event_log import event_log
+
+PENDING = "pending"    # Not started yet
+SPAWNING = "spawning"  # Enemies still to come
+ACTIVE = "active"      # Everything spawned, waiting for its enemies to be cleared
+CLEARED = "cleared"    # All of its enemies are gone
+
+
+class Wave:
+    """One entry of LevelData.waves and where it is in its lifecycle.
+
+    Definition keys: "enemy" (type name), "count", "spawn_rate" (seconds
+    between spawns) and optionally "start" (absolute start time, so waves can
+    overlap) or "delay" (seconds after the previous wave is cleared). Without
+    "start", a wave starts once the wave before it is cleared.
+    """
+
+    def __init__(self, index, definition):
+        self.index = index
+        self.enemy_type = definition.get("enemy")
+        self.count = definition["count"]
+        self.interval = definition["spawn_rate"]
+        self.start = definition.get("start")
+        self.delay = definition.get("delay", 0.0)
+        self.state = PENDING
+        self.start_time = None
+        self.cleared_time = None
+        self.spawned = 0
+        self.alive = 0
+
+    def spawn_time(self, n):
+        """Time of the n-th spawn (0-based), computed directly so it never drifts"""
+        return self.start_time + (n + 1) * self.interval
+
+
+class WaveTimeline:
+    """All spawns of a level as one time-ordered event heap.
+
+    The heap holds the next spawn of every wave that is spawning, keyed by
+    its exact time, so any number of spawns can fall in one tick and
+    overlapping waves interleave correctly. Spawn times depend only on the
+    wave definitions, never on the tick size.
+    """
+
+    def __init__(self, wave_definitions):
+        self.waves = [Wave(i, definition) for i, definition in enumerate(wave_definitions)]
+        self._events = []  # (time, wave index)
+
+        for wave in self.waves:
+            if wave.start is not None:
+                self._start(wave, wave.start)
+        if self.waves and self.waves[0].start is None:
+            self._start(self.waves[0], self.waves[0].delay)
+
+    def _start(self, wave, start_time):
+        wave.start_time = start_time
+        if wave.count > 0:
+            heapq.heappush(self._events, (wave.spawn_time(0), wave.index))
+        else:
+            wave.state = ACTIVE
+            self._check_cleared(wave, start_time)
+
+    def due(self, now):
+        """Yield (wave, spawn_time) for every spawn at or before now, in time order"""
+        events = self._events
+        while events and events[0][0] <= now:
+            spawn_time, index = heapq.heappop(events)
+            wave = self.waves[index]
+            wave.state = SPAWNING
+            wave.spawned += 1
+            wave.alive += 1
+            if wave.spawned < wave.count:
+                heapq.heappush(events, (wave.spawn_time(wave.spawned), index))
+            else:
+                wave.state = ACTIVE
+            yield wave, spawn_time
+
+    def enemy_removed(self, index, now):
+        """Count one of a wave's enemies as gone; may clear it and start the next wave"""
+        wave = self.waves[index]
+        wave.alive -= 1
+        self._check_cleared(wave, now)
+
+    def _check_cleared(self, wave, now):
+        if wave.state != ACTIVE or wave.alive > 0:
+            return
+        wave.state = CLEARED
+        wave.cleared_time = now
+        event_log.info("sim", "Wave %s cleared", wave.index + 1)
+
+        following = wave.index + 1
+        if following < len(self.waves):
+            upcoming = self.waves[following]
+            if upcoming.start is None and upcoming.state == PENDING:
+                self._start(upcoming, now + upcoming.delay)
+
+    @property
+    def current_wave(self):
+        """Index of the latest wave that has started (0 before anything starts)"""
+        started = [wave.index for wave in self.waves if wave.state != PENDING]
+        return started[-1] if started else 0
+
+    @property
+    def finished(self):
+        return all(wave.state == CLEARED for wave in self.waves)
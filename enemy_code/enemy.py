@@ -1,81 +1,70 @@
 import arcade
-import math
+from core.asset_cache import asset_cache
+from core.events import ENEMY_KILLED, ENEMY_LEAKED, ENEMY_REMOVED
+
+WALK_SHEET_PATH = "assets/enemies/Skeleton/Sprite Sheets/Skeleton Walk.png"
+DEATH_SHEET_PATH = "assets/enemies/Skeleton/Sprite Sheets/Skeleton Death.png"
 
 class Enemy(arcade.TextureAnimationSprite):
-    def __init__(self, spawn_point, path, speed=2, health=100, reward=25):
+    def __init__(self, spawn_point, path, speed=120, health=100, reward=25):
         super().__init__(scale=2.0)
+
+        # Walk and death frames are decoded once and shared by every enemy
+        self.walk_textures = asset_cache.get_texture_grid(WALK_SHEET_PATH, size=(22, 33), columns=13, count=13)
+
+        # Death animation (falls back to a fade-out when the sheet is missing)
+        self.death_textures = asset_cache.get_texture_grid(DEATH_SHEET_PATH, size=(22, 33), columns=8, count=8)
+
+        self.seconds_per_frame = 0.1
+        self.death_animation_duration = 1.0  # seconds for death animation
+
+        # HP bar dimensions
+        self.hp_bar_width = 40
+        self.hp_bar_height = 5
+        self.hp_bar_offset = 25
+
+        self.events = None  # EventBus of the simulation that spawned it
+
+        self.reset(spawn_point, path, speed, health, reward)
+
+    def reset(self, spawn_point, path, speed=120, health=100, reward=25):
+        """Put the enemy back at the spawn with fresh state (also used when reusing a pooled enemy)"""
         self.center_x, self.center_y = spawn_point
-        self.path = path
-        self.path_index = 0
-        self.speed = speed
+        self.path = path  # PathTable
+        self.distance = 0.0  # Pixels travelled along the path
+        self.prev_distance = 0.0  # Distance before the last step, for render interpolation
+        self.speed = speed  # Pixels per second
         self.health = health
         self.max_health = health
         self.reward = reward
         self.alive = True
+        self.active = True  # False while parked in an EnemyPool
         self.reached_end = False
 
-        # Load walk animation
-        sprite_sheet_path = "assets/enemies/Skeleton/Sprite Sheets/Skeleton Walk.png"
-        frame_width = 22
-        frame_height = 33
-        num_frames = 13
-
-        sheet = arcade.load_spritesheet(sprite_sheet_path)
-        textures = sheet.get_texture_grid(
-            size=(22, 33),
-            columns=13,
-            count=13,
-        )
-
-        # Add walk frames
-        for tex in textures:
-            self.append_texture(tex)
-        
-        # Load death animation (you'll need to create this spritesheet)
-        death_sheet_path = "assets/enemies/Skeleton/Sprite Sheets/Skeleton Death.png"
-        try:
-            death_sheet = arcade.load_spritesheet(death_sheet_path)
-            death_textures = death_sheet.get_texture_grid(
-                size=(22, 33),  # Adjust based on your death animation frame size
-                columns=8,      # Adjust based on your death animation frames
-                count=8,
-            )
-            self.death_textures = death_textures
-        except:
-            # Fallback: use a single frame or create simple death effect
-            self.death_textures = None
-
+        self.textures = self.walk_textures
         self.set_texture(0)
-
-        # Skip the first path point if it equals the spawn
-        if self.path and self.path[0] == (self.center_x, self.center_y):
-            self.path_index = 1
+        self.alpha = 255
+        self.visible = True
 
         # Animation control
         self.current_frame = 0
         self.time_accumulator = 0.0
-        self.seconds_per_frame = 0.1
 
         # Death animation control
         self.is_dying = False
         self.death_animation_time = 0.0
-        self.death_animation_duration = 1.0  # seconds for death animation
         self.death_frame = 0
 
-        # HP bar dimensions
-        self.hp_bar_width = 40
-        self.hp_bar_height = 5
-        self.hp_bar_offset = 25
-
     def take_damage(self, damage):
         """Reduce enemy health by damage amount"""
-        if self.is_dying:
-            return False  # Already dying
+        if self.is_dying or not self.alive:
+            return False  # Already dying, leaked or released
             
         self.health -= damage
         if self.health <= 0:
             self.health = 0
             self.start_death_animation()
+            self.emit(ENEMY_KILLED)
             return True  # Enemy died
         return False  # Enemy still alive
 
@@ -83,6 +72,7 @@ class Enemy(arcade.TextureAnimationSprite):
         """Start the death animation sequence"""
         self.alive = False
         self.is_dying = True
+        self.prev_distance = self.distance  # Stop interpolating movement
         self.death_animation_time = 0.0
         self.death_frame = 0
         
@@ -107,23 +97,41 @@ class Enemy(arcade.TextureAnimationSprite):
             self.set_texture(self.current_frame)
             self.time_accumulator = 0.0
 
-        # Movement
-        if self.path_index >= len(self.path):
-            self.reached_end = True
+        # Movement: advance along the path by speed * dt, position comes from the path table
+        self.prev_distance = self.distance
+        if self.distance >= self.path.total_length:
+            self.leak()
             return
 
-        dest_x, dest_y = self.path[self.path_index]
-        dx = dest_x - self.center_x
-        dy = dest_y - self.center_y
-        distance = math.sqrt(dx * dx + dy * dy)
+        self.distance = min(self.distance + self.speed * delta_time, self.path.total_length)
+        self.position = self.path.position(self.distance)
+
+    def leak(self):
+        """Take the enemy out of play at the end of the path"""
+        self.reached_end = True
+        self.alive = False
+        self.emit(ENEMY_LEAKED)
+        self.emit(ENEMY_REMOVED)
+
+    def emit(self, event_type):
+        if self.events is not None:
+            self.events.emit(event_type, self)
+
+    def interpolate(self, alpha):
+        """Place the sprite between its last two simulated positions (render only).
 
-        if distance > 0:
-            step = min(self.speed, distance)
-            self.center_x += dx / distance * step
-            self.center_y += dy / distance * step
+        The next update() puts it back on its simulated position before
+        anything reads it.
+        """
+        if self.prev_distance != self.distance:
+            self.position = self.path.position(self.prev_distance + (self.distance - self.prev_distance) * alpha)
 
-        if distance < self.speed:
-            self.path_index += 1
+    @property
+    def progress(self):
+        """Fraction of the path travelled, from 0.0 at the spawn to 1.0 at the exit"""
+        if not self.path.total_length:
+            return 1.0
+        return self.distance / self.path.total_length
 
     def update_death_animation(self, delta_time):
         """Update the death animation"""
@@ -137,13 +145,15 @@ class Enemy(arcade.TextureAnimationSprite):
             if current_frame < len(self.death_textures):
                 self.set_texture(current_frame)
             else:
-                # Animation complete, mark for removal
+                # Animation complete, ready for removal
                 self.is_dying = False
+                self.emit(ENEMY_REMOVED)
         else:
             # Simple fade-out effect if no death animation
             self.alpha = int(255 * (1 - self.death_animation_time / self.death_animation_duration))
             if self.death_animation_time >= self.death_animation_duration:
                 self.is_dying = False
+                self.emit(ENEMY_REMOVED)
 
     def draw_hp_bar(self):
         """Draw the HP bar above the enemy"""
@@ -176,12 +186,10 @@ class Enemy(arcade.TextureAnimationSprite):
             bar_color
         )
 
-    def should_remove(self):
-        """Check if enemy should be removed from game"""
-        return not self.alive and not self.is_dying
-
     def draw(self):
         """Override draw to include HP bar"""
+        if not self.active:
+            return
         if self.is_dying or self.alive:
             if self.alive:  # Only draw HP bar if alive
                 self.draw_hp_bar()
\ No newline at end of file
@@ -0,0 +1,65 @@
+from core.enemy_spawner import spawn_enemy
+
+
+class EnemyPool:
+    """Free list of retired enemies that are reset and reused on spawn.
+
+    Pooled enemies stay in the simulation's SpriteList, hidden, so spawning
+    and retiring an enemy never inserts into or removes from the list. The
+    list is only trimmed by compact(), in one batch, when far more enemies
+    are parked than are likely to be needed again.
+    """
+
+    def __init__(self, sprite_list, store=None, min_free=64):
+        self.sprite_list = sprite_list
+        self.store = store
+        self.min_free = min_free
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, spawn_point, path, **kwargs):
+        """Return a ready-to-use enemy, reusing a pooled one when possible"""
+        if self.free:
+            enemy = self.free.pop()
+            enemy.reset(spawn_point, path, **kwargs)
+            self.reused += 1
+            return enemy
+
+        enemy = spawn_enemy(spawn_point, path, self.store, **kwargs)
+        self.sprite_list.append(enemy)
+        self.created += 1
+        return enemy
+
+    def release(self, enemy):
+        """Park a finished enemy until it is needed again"""
+        if self.store is not None:
+            # Drop the handle's slot too; the store may give it to another enemy right away
+            self.store.release(enemy.slot)
+            enemy.slot = None
+        enemy.active = False
+        enemy.visible = False
+        self.free.append(enemy)
+
+    def compact(self):
+        """Drop surplus pooled enemies from the sprite list in a single rebuild.
+
+        Only runs once more than twice as many enemies are parked as are in
+        play (or as min_free), and then trims back down to that many; the most
+        recently released enemies are the ones kept.
+        """
+        active = len(self.sprite_list) - len(self.free)
+        keep = max(self.min_free, active)
+        if len(self.free) <= 2 * keep:
+            return 0
+        surplus = len(self.free) - keep
+
+        dropped = set(self.free[:surplus])
+        del self.free[:surplus]
+        survivors = [enemy for enemy in self.sprite_list if enemy not in dropped]
+        self.sprite_list.clear()
+        self.sprite_list.extend(survivors)
+        return surplus
+
+    def stats(self):
+        return {"created": self.created, "reused": self.reused, "free": len(self.free)}
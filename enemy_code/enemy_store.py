@@ -0,0 +1,244 @@
+import numpy as np
+from core.events import ENEMY_REMOVED
+from enemy_code.enemy import Enemy
+
+
+def _column(name):
+    """Property that reads/writes this enemy's slot in one of the store's arrays.
+
+    A released enemy has no slot: it reads as zero/False (so not alive) and
+    ignores writes, so a stale handle can never touch whoever took the slot.
+    """
+    def fget(self):
+        if self.slot is None:
+            return getattr(self.store, name).dtype.type(0).item()
+        return getattr(self.store, name)[self.slot].item()
+
+    def fset(self, value):
+        if self.slot is not None:
+            getattr(self.store, name)[self.slot] = value
+
+    return property(fget, fset)
+
+
+class StoredEnemy(Enemy):
+    """Enemy whose simulation state lives in an EnemyStore slot.
+
+    center_x/center_y, health and the movement/animation fields read and
+    write the store's arrays, so Enemy's own methods (take_damage,
+    start_death_animation, draw_hp_bar) keep working unchanged. The sprite's
+    render position (``position``) is only updated by EnemyStore.sync_sprites().
+    """
+
+    center_x = _column("x")
+    center_y = _column("y")
+    speed = _column("speed")
+    health = _column("health")
+    distance = _column("distance")
+    prev_distance = _column("prev_distance")
+    alive = _column("alive")
+    is_dying = _column("dying")
+    reached_end = _column("reached_end")
+    current_frame = _column("frame")
+    time_accumulator = _column("anim_time")
+    death_animation_time = _column("death_time")
+
+    def __init__(self, spawn_point, path, store, **kwargs):
+        self.store = store
+        self.slot = None
+        super().__init__(spawn_point, path, **kwargs)
+
+    def reset(self, spawn_point, path, *args, **kwargs):
+        """Take a fresh store slot, then reset state into it"""
+        self.slot = self.store.allocate(self)
+        super().reset(spawn_point, path, *args, **kwargs)
+        self.position = spawn_point
+
+    def update(self, delta_time: float = 1/60):
+        """Movement and animation are advanced for all stored enemies by EnemyStore.update()"""
+        pass
+
+
+class EnemyStore:
+    """Structure-of-arrays enemy state with one vectorized update per tick.
+
+    Positions, health, speed, path index and alive/dying flags are kept in
+    contiguous NumPy arrays indexed by slot. Movement, death checks and
+    animation frame advance each run as a single array operation; sprites are
+    only touched when syncing for rendering. The store also answers the same
+    range queries as EnemyGrid, so towers can target straight from the arrays.
+    """
+
+    def __init__(self, path_table, capacity=256):
+        # Segment tables for vectorized distance -> position lookups
+        self.path_table = path_table
+        self.total_length = path_table.total_length
+        self.cumulative = np.asarray(path_table.cumulative, dtype=np.float64)
+        self.segment_starts = np.asarray(path_table.points[:-1] or [(0.0, 0.0)], dtype=np.float64).reshape(-1, 2)
+        self.directions = np.asarray(path_table.directions or [(0.0, 0.0)], dtype=np.float64).reshape(-1, 2)
+        self.capacity = 0
+        self.handles = []
+        self.free_slots = []
+        self.walk_frames = 1
+        self.death_frames = 0
+        self.seconds_per_frame = 0.1
+        self.death_animation_duration = 1.0
+
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.speed = np.zeros(0)
+        self.health = np.zeros(0)
+        self.distance = np.zeros(0)
+        self.prev_distance = np.zeros(0)
+        self.frame = np.zeros(0, dtype=np.int64)
+        self.anim_time = np.zeros(0)
+        self.death_time = np.zeros(0)
+        self.active = np.zeros(0, dtype=bool)
+        self.alive = np.zeros(0, dtype=bool)
+        self.dying = np.zeros(0, dtype=bool)
+        self.reached_end = np.zeros(0, dtype=bool)
+        self._grow(capacity)
+
+        self._query_slots = np.zeros(0, dtype=np.int64)
+        self.count = 0
+
+    def _grow(self, capacity):
+        """Resize every array to the new capacity, keeping existing slots"""
+        for name in ("x", "y", "speed", "health", "distance", "prev_distance", "frame", "anim_time", "death_time",
+                     "active", "alive", "dying", "reached_end"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self.handles.extend([None] * (capacity - self.capacity))
+        self.free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def allocate(self, enemy):
+        """Reserve a slot for a new enemy"""
+        if not self.free_slots:
+            self._grow(max(16, self.capacity * 2))
+        slot = self.free_slots.pop()
+        self.handles[slot] = enemy
+        self.active[slot] = True
+        self.x[slot] = self.y[slot] = self.distance[slot] = self.prev_distance[slot] = 0.0
+        self.frame[slot] = 0
+        self.anim_time[slot] = self.death_time[slot] = 0.0
+        return slot
+
+    def release(self, slot):
+        """Free a slot so it can be reused"""
+        self.active[slot] = False
+        self.alive[slot] = False
+        self.dying[slot] = False
+        self.handles[slot] = None
+        self.free_slots.append(slot)
+
+    def spawn(self, spawn_point, path, **kwargs):
+        """Create a store-backed enemy"""
+        enemy = StoredEnemy(spawn_point, path, self, **kwargs)
+        self.walk_frames = len(enemy.textures)
+        self.death_frames = len(enemy.death_textures) if enemy.death_textures else 0
+        self.seconds_per_frame = enemy.seconds_per_frame
+        self.death_animation_duration = enemy.death_animation_duration
+        return enemy
+
+    def update(self, delta_time):
+        """Advance walk animation, movement and death animation for every enemy"""
+        walking = self.active & self.alive & ~self.dying
+
+        # Walk animation
+        self.anim_time[walking] += delta_time
+        flip = walking & (self.anim_time >= self.seconds_per_frame)
+        self.frame[flip] = (self.frame[flip] + 1) % self.walk_frames
+        self.anim_time[flip] = 0.0
+
+        # Movement: advance distance along the path, then look positions up in the path table
+        self.prev_distance[walking] = self.distance[walking]
+        at_end = walking & (self.distance >= self.total_length)
+        for slot in np.flatnonzero(at_end).tolist():
+            self.handles[slot].leak()
+        moving = np.flatnonzero(walking & ~at_end)
+        if len(moving):
+            distance = np.minimum(self.distance[moving] + self.speed[moving] * delta_time, self.total_length)
+            self.distance[moving] = distance
+            self.x[moving], self.y[moving] = self.positions(distance)
+
+        # Death animation; dying is cleared once it has played out
+        dying = np.flatnonzero(self.active & self.dying)
+        if len(dying):
+            self.death_time[dying] += delta_time
+            if self.death_frames:
+                frame_time = self.death_animation_duration / self.death_frames
+                self.frame[dying] = (self.death_time[dying] / frame_time).astype(np.int64)
+                done = self.frame[dying] >= self.death_frames
+            else:
+                done = self.death_time[dying] >= self.death_animation_duration
+            finished = dying[done]
+            self.dying[finished] = False
+            for slot in finished.tolist():
+                self.handles[slot].emit(ENEMY_REMOVED)
+
+    def positions(self, distance):
+        """Vectorized PathTable.position(): x and y arrays for an array of distances"""
+        segment = np.searchsorted(self.cumulative, distance, side="right") - 1
+        segment = np.clip(segment, 0, len(self.directions) - 1)
+        along = distance - self.cumulative[segment]
+        x = self.segment_starts[segment, 0] + self.directions[segment, 0] * along
+        y = self.segment_starts[segment, 1] + self.directions[segment, 1] * along
+        return x, y
+
+    def rebuild(self, enemies=None):
+        """Snapshot the living enemies for this tick's range queries (mirrors EnemyGrid.rebuild)"""
+        self._query_slots = np.flatnonzero(self.active & self.alive & ~self.dying)
+        self.count = len(self._query_slots)
+
+    def query(self, x, y, radius):
+        """Return [(enemy, distance_squared), ...] for every living enemy within radius of (x, y)"""
+        slots = self._query_slots
+        dist_sq = (self.x[slots] - x) ** 2 + (self.y[slots] - y) ** 2
+        hits = np.flatnonzero((dist_sq <= radius * radius) & self.alive[slots])
+        return [(self.handles[slots[i]], dist_sq[i].item()) for i in hits.tolist()]
+
+    def nearest(self, x, y, radius):
+        """Return the closest living enemy within radius of (x, y), or None"""
+        slots = self._query_slots
+        if not len(slots):
+            return None
+        dist_sq = (self.x[slots] - x) ** 2 + (self.y[slots] - y) ** 2
+        # Enemies can die mid-tick after the snapshot was taken
+        dist_sq[~self.alive[slots]] = np.inf
+        best = int(np.argmin(dist_sq))
+        if dist_sq[best] > radius * radius:
+            return None
+        return self.handles[slots[best]]
+
+    def sync_sprites(self, alpha=None):
+        """Copy positions and animation frames into the sprites for rendering.
+
+        With an alpha, walking enemies are drawn that far between their
+        previous and current simulated positions.
+        """
+        slots = np.flatnonzero(self.active)
+        x = self.x[slots]
+        y = self.y[slots]
+        if alpha is not None:
+            walking = self.alive[slots] & ~self.dying[slots]
+            prev = self.prev_distance[slots[walking]]
+            x[walking], y[walking] = self.positions(prev + (self.distance[slots[walking]] - prev) * alpha)
+
+        fade = None
+        if not self.death_frames:
+            fade = np.clip(1 - self.death_time / self.death_animation_duration, 0, 1)
+
+        for slot, x, y, frame, dying in zip(slots.tolist(), x.tolist(), y.tolist(),
+                                            self.frame[slots].tolist(), self.dying[slots].tolist()):
+            enemy = self.handles[slot]
+            enemy.position = (x, y)
+            if frame < len(enemy.textures):
+                enemy.set_texture(frame)
+            if dying and fade is not None:
+                enemy.alpha = int(255 * fade[slot])
+
+    def __len__(self):
+        return self.count
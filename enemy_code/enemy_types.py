@@ -0,0 +1,13 @@
+from types import MappingProxyType
+
+# Enemy.reset() keyword arguments per wave "enemy" name
+ENEMY_TYPES = MappingProxyType({
+    "grunt": MappingProxyType({"speed": 120, "health": 100, "reward": 25}),
+    "fast": MappingProxyType({"speed": 200, "health": 60, "reward": 20}),
+    "tank": MappingProxyType({"speed": 70, "health": 300, "reward": 60}),
+})
+
+
+def enemy_stats(enemy_type):
+    """Spawn arguments for an enemy type (unknown types and None spawn a grunt)"""
+    return ENEMY_TYPES.get(enemy_type, ENEMY_TYPES["grunt"])
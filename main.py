@@ -1,12 +1,17 @@
 import arcade
 from core.MainMenu import MainMenu
 from core.constants import *
+from core.event_log import event_log
 
 def main():
+    event_log.configure(EVENT_LOG_LEVEL, EVENT_LOG_ECHO_LEVEL, EVENT_LOG_CATEGORIES, EVENT_LOG_CAPACITY)
+    if EVENT_LOG_FILE:
+        event_log.start_flush(EVENT_LOG_FILE)
     window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
     menu_view = MainMenu()
     window.show_view(menu_view)
     arcade.run()
+    event_log.stop_flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
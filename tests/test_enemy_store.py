@@ -0,0 +1,34 @@
+from core.event_log import event_log
+from core.LevelManager import LevelManager
+from core.simulation import Simulation
+
+
+def make_sim():
+    event_log.configure(level="error", echo_level="error")
+    return Simulation.from_level(LevelManager().levels[1], seed=1, use_enemy_store=True)
+
+
+def test_released_handle_is_not_targetable_after_slot_reuse():
+    sim = make_sim()
+    tower = sim.place_tower("basic", *sim.spawn_point)
+    stale = sim.spawn_enemy()
+    slot = stale.slot
+    tower.current_target = stale
+
+    stale.leak()
+    sim.end_tick()
+    assert stale.slot is None
+
+    # A brand-new object takes the freed slot, as happens after compact()
+    fresh = sim.enemy_store.spawn(sim.spawn_point, sim.path_table)
+    assert fresh.slot == slot
+    assert fresh.alive
+
+    assert not stale.alive
+    assert not sim.targeting.in_range(tower, stale)
+    assert tower.find_target(sim.targeting) is not stale
+
+    money, health = sim.money, fresh.health
+    assert stale.take_damage(10_000) is False
+    assert fresh.health == health
+    assert sim.money == money
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from benchmarks.upgrade_odds import simulate
+
+
+def test_starting_level_uses_that_levels_stats_and_prices():
+    # A basic tower (15 damage, 150 range, 1.0 attack speed) two damage upgrades in is at 45 damage
+    summaries = simulate("basic", "damage", 8, np.random.default_rng(0), level=3)
+    assert [summary["level"] for summary in summaries] == [4, 5, 6, 7]
+
+    first = summaries[0]
+    assert first["spent"]["mean"] == 300  # upgrading from level 3
+    assert first["stats"]["damage"]["mean"] == 60
+    assert first["stats"]["damage"]["per_coin"]["mean"] == pytest.approx(15 / 300)
+    assert first["stats"]["range"]["per_coin"]["mean"] == 0
+
+    last = summaries[-1]
+    assert last["spent"]["mean"] == 300 + 400 + 500 + 600
+    assert last["stats"]["damage"]["mean"] == 105
+    assert last["stats"]["damage"]["per_coin"]["mean"] == pytest.approx(60 / 1800)
+
+
+def test_wheel_only_from_level_one():
+    with pytest.raises(ValueError):
+        simulate("basic", "wheel", 8, np.random.default_rng(0), level=2)
@@ -1,6 +1,11 @@
 import arcade
-import math
 import random
+from core.event_log import event_log
+from tower_code.tower_stats import tower_properties
+from tower_code.targeting import DEFAULT_TARGETING
+from tower_code.upgrade_rules import (
+    MAX_LEVEL, UPGRADE_GAMBLE_ROLLS, UPGRADE_PATHS, apply_effects, roll_upgrade_gamble, upgrade_cost,
+)
 
 class Tower(arcade.Sprite):
     def __init__(self, tower_type: str, image_path: str, scale: float = 1.0):
@@ -14,11 +19,11 @@ class Tower(arcade.Sprite):
         # Attack system
         self.attack_cooldown = 0.0
         self.current_target = None
-        self.projectiles = arcade.SpriteList()
+        self.targeting = DEFAULT_TARGETING
         
         # Level system
         self.level = 1
-        self.max_level = 7
+        self.max_level = MAX_LEVEL
         self.upgrade_path = None
         self.upgrade_cost = self.properties["upgrade_cost"]
         
@@ -29,82 +34,38 @@ class Tower(arcade.Sprite):
         self.attack_end_pos = (0, 0)
 
     def _get_tower_properties(self):
-        """Return tower stats based on type"""
-        base_stats = {
-            "basic": {
-                "range": 150, "damage": 15, "attack_speed": 1.0, "cost": 100,
-                "upgrade_cost": 50, "projectile_speed": 300,
-                "description": "Basic tower with balanced stats"
-            },
-            "archer": {
-                "range": 200, "damage": 10, "attack_speed": 1.5, "cost": 120,
-                "upgrade_cost": 60, "projectile_speed": 400,
-                "description": "Fast attacking archer tower"
-            },
-            "cannon": {
-                "range": 120, "damage": 30, "attack_speed": 0.7, "cost": 150,
-                "upgrade_cost": 75, "projectile_speed": 200,
-                "description": "Slow but powerful cannon"
-            },
-            "sniper": {
-                "range": 300, "damage": 25, "attack_speed": 0.5, "cost": 200,
-                "upgrade_cost": 100, "projectile_speed": 500,
-                "description": "Long range sniper tower"
-            },
-            "ice": {
-                "range": 180, "damage": 5, "attack_speed": 0.8, "cost": 180,
-                "upgrade_cost": 90, "projectile_speed": 250,
-                "slow_effect": 0.5, "slow_duration": 3.0,
-                "description": "Slows enemies"
-            }
-        }
-        return base_stats.get(self.tower_type, base_stats["basic"])
+        """Return tower stats based on type (shared base stats plus this tower's own changes)"""
+        return tower_properties(self.tower_type)
 
     def update(self, delta_time: float):
         """Update tower state and attack cooldown"""
         self.attack_cooldown -= delta_time
         
-        # Update projectiles
-        self.projectiles.update()
-        
         # Update attack effect timer
         if self.show_attack_effect:
             self.attack_effect_timer -= delta_time
             if self.attack_effect_timer <= 0:
                 self.show_attack_effect = False
 
-    def find_target(self, enemies: arcade.SpriteList):
-        """Find the closest enemy within range"""
-        self.current_target = None
-        closest_distance = float('inf')
-        
-        for enemy in enemies:
-            if not hasattr(enemy, 'alive') or not enemy.alive:
-                continue
-                
-            distance = math.sqrt(
-                (self.center_x - enemy.center_x) ** 2 +
-                (self.center_y - enemy.center_y) ** 2
-            )
-            
-            if distance <= self.properties["range"] and distance < closest_distance:
-                self.current_target = enemy
-                closest_distance = distance
-        
-        return self.current_target
+    def find_target(self, targeting):
+        """Keep the current target while it stays in range, otherwise pick one by targeting mode"""
+        target = self.current_target
+        if target is None or not targeting.in_range(self, target):
+            target = self.current_target = targeting.select(self)
+        return target
 
-    def attack(self, delta_time: float, enemies: arcade.SpriteList):
+    def attack(self, delta_time: float, targeting, projectiles):
         """Attack if cooldown is ready and target is available"""
         if self.attack_cooldown > 0:
             return False
             
-        target = self.find_target(enemies)
+        target = self.find_target(targeting)
         if not target:
             return False
             
         # Create projectile or direct damage based on tower type
         if self.tower_type in ["basic", "archer", "cannon", "sniper"]:
-            self.create_projectile(target)
+            self.create_projectile(target, projectiles)
         else:
             # Direct damage for special towers
             self.apply_direct_damage(target)
@@ -120,18 +81,16 @@ class Tower(arcade.Sprite):
         
         return True
 
-    def create_projectile(self, target):
-        """Create a projectile sprite"""
-        projectile = arcade.Sprite(":resources:images/space_shooter/laserBlue01.png", 0.5)
-        projectile.center_x = self.center_x
-        projectile.center_y = self.center_y
-        projectile.properties = {
-            "damage": self.properties["damage"],
-            "speed": self.properties["projectile_speed"],
-            "target": target,
-            "tower_type": self.tower_type
-        }
-        self.projectiles.append(projectile)
+    def create_projectile(self, target, projectiles):
+        """Fire a projectile from the shared projectile pool"""
+        projectiles.fire(
+            self.center_x,
+            self.center_y,
+            target,
+            damage=self.properties["damage"],
+            speed=self.properties["projectile_speed"],
+            tower_type=self.tower_type
+        )
 
     def apply_direct_damage(self, target):
         """Apply damage directly (for special towers)"""
@@ -218,49 +177,37 @@ class Tower(arcade.Sprite):
         return self.level < self.max_level
     
     def get_upgrade_cost(self):
-        return 100 * self.level
+        return upgrade_cost(self.level)
     
-    def get_next_level_stats(self, path=None):
-        """Preview next stats without committing"""
+    def get_next_level_stats(self, path=None, rng=random):
+        """Preview next stats without committing.
+
+        The gamble path rolls with rng; the simulation passes its seeded RNG,
+        menu previews use the global one so they never disturb a replay.
+        """
         if not path:
             path = self.upgrade_path or "balanced"
 
+        # Copies only this tower's delta; the base stats stay shared
         new_stats = self.properties.copy()
-        if path == "damage":
-            new_stats["damage"] += 15
-        elif path == "range":
-            new_stats["attack_speed"] += 20
-            new_stats["damage"] += 5
-        elif path == "range":
-            new_stats["range"] += 25
-            new_stats["damage"] += 5
-        elif path == "gamble":
-            roll = random.choice(["jackpot", "dud", "mixed"])
-            if roll == "jackpot":
-                new_stats["damage"] += 10
-                new_stats["attack_speed"] *= 1.5
-            elif roll == "dud":
-                new_stats["damage"] = max(1, new_stats["damage"] - 5)
-                new_stats["range"] = max(50, new_stats["range"] - 20)
-            elif roll == "mixed":
-                new_stats["damage"] += 3
-                new_stats["range"] += 10
-
+        if path == "gamble":
+            apply_effects(new_stats, UPGRADE_GAMBLE_ROLLS[roll_upgrade_gamble(rng)][1])
+        elif path in UPGRADE_PATHS:
+            apply_effects(new_stats, UPGRADE_PATHS[path])
 
         return new_stats
 
-    def upgrade(self, path=None):
+    def upgrade(self, path=None, rng=random):
         if self.level >= self.max_level:
             return False
         if not self.upgrade_path:
             self.upgrade_path = path  # first upgrade picks a path
 
         if path and self.upgrade_path != path:
-            print("Can't switch paths mid-upgrade!")
+            event_log.info("sim", "Can't switch paths mid-upgrade!")
             return False
 
-        new_stats = self.get_next_level_stats(self.upgrade_path)
-        self.properties.update(new_stats)
+        self.properties = self.get_next_level_stats(self.upgrade_path, rng)
         self.level += 1
         return True
 
@@ -1,4 +1,5 @@
 import arcade
+from core.event_log import event_log
 
 class TowerMenuClass:
     def __init__(self, height):
@@ -35,7 +36,7 @@ class TowerMenuClass:
             self.selected_tower_type = clicked_icon.properties["type"]
             self.selected_tower_image = clicked_icon.properties["image_path"]
             self.selected_tower_scale = clicked_icon.properties["scale"]
-            print(f"Selected tower: {self.selected_tower_type}")
+            event_log.debug("ui", "Selected tower: %s", self.selected_tower_type)
             self.ghost_tower = arcade.Sprite(
             self.selected_tower_image, 
             self.selected_tower_scale
@@ -0,0 +1,56 @@
+TARGETING_MODES = ("first", "last", "strongest", "weakest", "closest")
+DEFAULT_TARGETING = "first"
+
+
+class TargetSelector:
+    """Picks a target for a tower according to its targeting mode.
+
+    first/last come straight from the progress index, strongest/weakest
+    compare the enemies in range by health (ties go to the one further
+    along), and closest uses the spatial index. A tower's reach along the
+    path (PathTable.coverage) is cached until it moves or its range changes.
+    """
+
+    def __init__(self, path_table, progress_index, enemy_index):
+        self.path_table = path_table
+        self.progress_index = progress_index
+        self.enemy_index = enemy_index
+        self._coverage = {}  # tower -> ((x, y, range), intervals)
+
+    def coverage(self, tower):
+        key = (tower.center_x, tower.center_y, tower.properties["range"])
+        cached = self._coverage.get(tower)
+        if cached is None or cached[0] != key:
+            cached = self._coverage[tower] = (key, self.path_table.coverage(*key))
+        return cached[1]
+
+    def select(self, tower):
+        mode = tower.targeting
+        if mode == "closest":
+            return self.enemy_index.nearest(tower.center_x, tower.center_y, tower.properties["range"])
+        if mode == "first":
+            return self.progress_index.furthest(self.coverage(tower))
+        if mode == "last":
+            return self.progress_index.nearest_start(self.coverage(tower))
+
+        candidates = self.progress_index.within(self.coverage(tower))
+        if not candidates:
+            return None
+        if mode == "strongest":
+            # Candidates are in path order, so max() keeps the furthest on ties by scanning backwards
+            return max(reversed(candidates), key=lambda enemy: enemy.health)
+        if mode == "weakest":
+            return min(reversed(candidates), key=lambda enemy: enemy.health)
+        raise ValueError(f"Unknown targeting mode {mode!r}")
+
+    def in_range(self, tower, enemy):
+        """Whether a tower can still hit an enemy it is already targeting"""
+        if not enemy.active or not enemy.alive or enemy.is_dying:
+            return False
+        dx = enemy.center_x - tower.center_x
+        dy = enemy.center_y - tower.center_y
+        reach = tower.properties["range"]
+        return dx * dx + dy * dy <= reach * reach
+
+    def forget(self, tower):
+        self._coverage.pop(tower, None)
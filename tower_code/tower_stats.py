@@ -0,0 +1,50 @@
+from collections import ChainMap
+from types import MappingProxyType
+
+# Base stats per tower type. Built once and read-only; every tower of a type
+# shares the same mapping and keeps its own changes in a small delta on top.
+TOWER_STATS = MappingProxyType({
+    tower_type: MappingProxyType(stats) for tower_type, stats in {
+        "basic": {
+            "range": 150, "damage": 15, "attack_speed": 1.0, "cost": 100,
+            "upgrade_cost": 50, "projectile_speed": 300,
+            "description": "Basic tower with balanced stats"
+        },
+        "archer": {
+            "range": 200, "damage": 10, "attack_speed": 1.5, "cost": 120,
+            "upgrade_cost": 60, "projectile_speed": 400,
+            "description": "Fast attacking archer tower"
+        },
+        "cannon": {
+            "range": 120, "damage": 30, "attack_speed": 0.7, "cost": 150,
+            "upgrade_cost": 75, "projectile_speed": 200,
+            "description": "Slow but powerful cannon"
+        },
+        "sniper": {
+            "range": 300, "damage": 25, "attack_speed": 0.5, "cost": 200,
+            "upgrade_cost": 100, "projectile_speed": 500,
+            "description": "Long range sniper tower"
+        },
+        "ice": {
+            "range": 180, "damage": 5, "attack_speed": 0.8, "cost": 180,
+            "upgrade_cost": 90, "projectile_speed": 250,
+            "slow_effect": 0.5, "slow_duration": 3.0,
+            "description": "Slows enemies"
+        },
+    }.items()
+})
+
+
+def base_stats(tower_type):
+    """Shared read-only stats for a tower type (unknown types fall back to basic)"""
+    return TOWER_STATS.get(tower_type, TOWER_STATS["basic"])
+
+
+def tower_stat(tower_type, name, default=None):
+    """Look up one base stat without building a tower"""
+    return base_stats(tower_type).get(name, default)
+
+
+def tower_properties(tower_type):
+    """Mutable stats for one tower: writes land in its own delta, reads fall through to the base"""
+    return ChainMap({}, base_stats(tower_type))
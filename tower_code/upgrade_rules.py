@@ -0,0 +1,43 @@
+"""Stat changes made by tower upgrades and gamble rolls, as data.
+
+An effect is (stat, multiplier, addend, floor): the stat becomes
+max(floor, stat * multiplier + addend), or stat * multiplier + addend when
+floor is None. Tower applies these one tower at a time; the Monte Carlo
+engine in benchmarks/upgrade_odds.py applies the very same tables to whole
+NumPy arrays, so its numbers always match the game.
+"""
+
+# Per-level effect of each regular upgrade path
+UPGRADE_PATHS = {
+    "damage": (("damage", 1, 15, None),),
+    "speed": (("attack_speed", 1, 20, None), ("damage", 1, 5, None)),
+    "range": (("range", 1, 25, None), ("damage", 1, 5, None)),
+}
+
+# The gamble upgrade path rolls one of these per level: name -> (weight, effects)
+UPGRADE_GAMBLE_ROLLS = {
+    "jackpot": (1, (("damage", 1, 10, None), ("attack_speed", 1.5, 0, None))),
+    "dud": (1, (("damage", 1, -5, 1), ("range", 1, -20, 50))),
+    "mixed": (1, (("damage", 1, 3, None), ("range", 1, 10, None))),
+}
+
+MAX_LEVEL = 7
+UPGRADE_COST_PER_LEVEL = 100
+
+
+def upgrade_cost(level):
+    """Price of upgrading (or spinning the gamble wheel for) a tower at this level"""
+    return UPGRADE_COST_PER_LEVEL * level
+
+
+def apply_effects(stats, effects):
+    """Apply effects to a mutable stats mapping in place"""
+    for stat, multiplier, addend, floor in effects:
+        value = stats[stat] * multiplier + addend
+        stats[stat] = value if floor is None else max(floor, value)
+
+
+def roll_upgrade_gamble(rng):
+    """Pick a gamble-path roll by weight with a random.Random-like rng"""
+    names = list(UPGRADE_GAMBLE_ROLLS)
+    return rng.choices(names, weights=[UPGRADE_GAMBLE_ROLLS[name][0] for name in names])[0]